@@ -7,15 +7,27 @@ sprint health scoring, velocity forecasting, and leadership-specific insights.
 import re
 import json
 import asyncio
+import time
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
 from enum import Enum
+from collections import OrderedDict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fixed prompts issued by the dashboard endpoints; their results are briefly cached
+SPRINT_HEALTH_QUERY = "What's our sprint health status?"
+TEAM_PERFORMANCE_QUERY = "Compare team performance this sprint"
+CANONICAL_QUERIES = frozenset({SPRINT_HEALTH_QUERY, TEAM_PERFORMANCE_QUERY})
+CANONICAL_CACHE_TTL = 30  # seconds
+
+# Semantic search answer cache
+SEMANTIC_CACHE_TTL = 600  # seconds
+SEMANTIC_CACHE_MAX_ENTRIES = 10000
+
 class QueryIntent(Enum):
     SPRINT_HEALTH = "sprint_health"
     TEAM_PERFORMANCE = "team_performance"
@@ -60,6 +72,42 @@ class RiskAlert:
     days_blocked: Optional[int]
     impact_score: float
 
+class SemanticQueryCache:
+    """LRU + TTL answer cache keyed by the normalized query text.
+    
+    Only exact matches after normalization hit: fuzzy matching would treat queries that differ
+    in a single issue key, project or name (ABC-123 vs ABC-124, John vs Joan) as the same query.
+    """
+    
+    def __init__(self, ttl: float = SEMANTIC_CACHE_TTL, max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def _normalize(query: str) -> str:
+        """Case- and whitespace-insensitive key; punctuation inside the query is kept since it can carry meaning"""
+        return " ".join(query.lower().split()).rstrip("?!. ")
+    
+    def get(self, query: str) -> Optional[Any]:
+        """Return the cached answer for this query, if still fresh"""
+        key = self._normalize(query)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+    
+    def put(self, query: str, value: Any) -> None:
+        key = self._normalize(query)
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
 class SemanticSearchEngine:
     """Semantic search using embeddings for fuzzy ticket matching"""
     
@@ -458,9 +506,26 @@ class AdvancedChatbotEngine:
         self.velocity_forecaster = VelocityForecaster()
         self.risk_detector = AdvancedRiskDetector()
         self.anomaly_detector = AnomalyDetector()
+        self._canonical_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self.semantic_cache = SemanticQueryCache()
         
     async def process_advanced_query(self, query: str) -> Dict[str, Any]:
-        """Process query with advanced features"""
+        """Process query with advanced features, reusing recent results for canonical prompts"""
+        if query not in CANONICAL_QUERIES:
+            return await self._process_query(query)
+        
+        now = time.monotonic()
+        cached = self._canonical_cache.get(query)
+        if cached and now - cached[0] < CANONICAL_CACHE_TTL:
+            return cached[1]
+        
+        result = await self._process_query(query)
+        if not result.get('error'):
+            self._canonical_cache[query] = (now, result)
+        return result
+    
+    async def _process_query(self, query: str) -> Dict[str, Any]:
+        """Parse, classify and dispatch a query to its processor"""
         
         # 1. Parse multi-intent queries
         intents = self.multi_intent_processor.parse_multi_intent_query(query)
@@ -2,12 +2,17 @@
 Analytics Engine for Jira Leadership Quality Tool
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Projects processed at once. Each project issues five lookups concurrently; the overall number of
+# in-flight Jira requests is capped separately by JiraClient's SEARCH_CONCURRENCY semaphore.
+PROJECT_FETCH_CONCURRENCY = 5
+
 class AdvancedAnalyticsEngine:
     """Advanced Analytics Engine for generating comprehensive Jira analytics"""
     
@@ -51,49 +56,32 @@ class AdvancedAnalyticsEngine:
             # Get assignees from all projects
             all_assignees = set()
             
-            # Process each project
-            for project_key in project_keys:
-                try:
-                    # Get project issues count
-                    project_jql = f"project = {project_key}"
-                    total_count = await self.jira_client.count(project_jql)
-                    
-                    # Get story count
-                    story_jql = f"project = {project_key} AND issuetype = Story"
-                    story_count = await self.jira_client.count(story_jql)
-                    
-                    # Get defect count
-                    defect_jql = f"project = {project_key} AND issuetype in (Bug, Defect)"
-                    defect_count = await self.jira_client.count(defect_jql)
-                    
-                    # Get task count
-                    task_jql = f"project = {project_key} AND issuetype = Task"
-                    task_count = await self.jira_client.count(task_jql)
-                    
-                    # Get assignees for this project
-                    project_assignees = await self.jira_client.get_assignees_for_project(project_key)
-                    all_assignees.update(project_assignees)
-                    
-                    # Store project data
-                    analytics['projects'][project_key] = {
-                        'name': project_key,
-                        'stories': story_count,
-                        'defects': defect_count,
-                        'tasks': task_count,
-                        'total_issues': total_count,
-                        'assignee_count': len(project_assignees),
-                        'assignees': list(project_assignees)
-                    }
-                    
-                    # Update summary totals
-                    analytics['summary']['total_stories'] += story_count
-                    analytics['summary']['total_defects'] += defect_count
-                    analytics['summary']['total_tasks'] += task_count
-                    analytics['summary']['total_issues'] += total_count
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing project {project_key}: {e}")
+            # Process projects concurrently, bounded to avoid Jira throttling
+            semaphore = asyncio.Semaphore(PROJECT_FETCH_CONCURRENCY)
+            
+            async def fetch_project(project_key: str):
+                async with semaphore:
+                    return await self._collect_project_data(project_key)
+            
+            results = await asyncio.gather(
+                *(fetch_project(project_key) for project_key in project_keys),
+                return_exceptions=True
+            )
+            
+            for project_key, result in zip(project_keys, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error processing project {project_key}: {result}")
                     continue
+                
+                project_data, project_assignees = result
+                all_assignees.update(project_assignees)
+                analytics['projects'][project_key] = project_data
+                
+                # Update summary totals
+                analytics['summary']['total_stories'] += project_data['stories']
+                analytics['summary']['total_defects'] += project_data['defects']
+                analytics['summary']['total_tasks'] += project_data['tasks']
+                analytics['summary']['total_issues'] += project_data['total_issues']
             
             # Update total assignees
             analytics['summary']['total_assignees'] = len(all_assignees)
@@ -132,6 +120,27 @@ class AdvancedAnalyticsEngine:
                 'error': str(e)
             }
     
+    async def _collect_project_data(self, project_key: str):
+        """Fetch issue counts and assignees for a single project"""
+        total_count, story_count, defect_count, task_count, project_assignees = await asyncio.gather(
+            self.jira_client.count(f"project = {project_key}"),
+            self.jira_client.count(f"project = {project_key} AND issuetype = Story"),
+            self.jira_client.count(f"project = {project_key} AND issuetype in (Bug, Defect)"),
+            self.jira_client.count(f"project = {project_key} AND issuetype = Task"),
+            self.jira_client.get_assignees_for_project(project_key)
+        )
+        
+        project_data = {
+            'name': project_key,
+            'stories': story_count,
+            'defects': defect_count,
+            'tasks': task_count,
+            'total_issues': total_count,
+            'assignee_count': len(project_assignees),
+            'assignees': list(project_assignees)
+        }
+        return project_data, project_assignees
+    
     def detect_anomalies(self, analytics: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect anomalies in the analytics data"""
         anomalies = []
@@ -2,6 +2,8 @@ import httpx
 import logging
 from typing import Any, Dict, List, Optional
 
+from utils.http_utils import HTTP2_AVAILABLE, HTTP_LIMITS, json_loads
+
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +25,7 @@ class ConfluenceClient:
         if not self._client:
             auth = (self.cfg.email, self.cfg.api_token)
             timeout = httpx.Timeout(30.0, read=30.0)
-            self._client = httpx.AsyncClient(auth=auth, timeout=timeout)
+            self._client = httpx.AsyncClient(auth=auth, timeout=timeout, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE)
 
     async def close(self):
         if self._client:
@@ -33,17 +35,28 @@ class ConfluenceClient:
                 pass
             self._client = None
 
+    async def preconnect(self, timeout: float = 5.0) -> None:
+        """Open a pooled connection (TCP/TLS, HTTP/2 session) ahead of the first real request."""
+        if not self._client:
+            await self.initialize()
+        try:
+            await self._client.head(self.cfg.base_url, headers=self._headers(), timeout=timeout)
+        except Exception as e:
+            logger.debug(f"[Confluence] preconnect failed: {e}")
+
     def _headers(self) -> Dict[str, str]:
         return {"Accept": "application/json"}
 
-    async def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
-        """Search Confluence using CQL for full-text across pages."""
+    async def search(self, query: str, limit: int = 5, order_by: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Search Confluence using CQL for full-text across pages, optionally ordered (e.g. "created desc")."""
         if not self._client:
             await self.initialize()
 
         # Confluence Cloud search API
         url = f"{self.cfg.base_url}/rest/api/search"
         cql = f'text ~ "{query}"'
+        if order_by:
+            cql += f" order by {order_by}"
         params = {
             "cql": cql,
             "limit": str(limit),
@@ -51,7 +64,7 @@ class ConfluenceClient:
         try:
             resp = await self._client.get(url, params=params, headers=self._headers())
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
             # Results contain content with id/type, and excerpt
             results = data.get("results", [])
             return results
@@ -76,7 +89,7 @@ class ConfluenceClient:
         try:
             resp = await self._client.get(url, params=params, headers=self._headers())
             resp.raise_for_status()
-            return resp.json().get("results", [])
+            return json_loads(resp.content).get("results", [])
         except Exception as e:
             logger.error(f"[Confluence] search_pages failed: {e}")
             return []
@@ -99,17 +112,17 @@ class ConfluenceClient:
         except Exception:
             return storage_html
 
-    async def get_page(self, content_id: str) -> Optional[Dict[str, Any]]:
-        """Get a Confluence page with storage format body."""
+    async def get_page(self, content_id: str, expand: str = "body.storage,version,space") -> Optional[Dict[str, Any]]:
+        """Get a Confluence page, by default with its storage format body."""
         if not self._client:
             await self.initialize()
 
         url = f"{self.cfg.base_url}/rest/api/content/{content_id}"
-        params = {"expand": "body.storage,version,space"}
+        params = {"expand": expand}
         try:
             resp = await self._client.get(url, params=params, headers=self._headers())
             resp.raise_for_status()
-            return resp.json()
+            return json_loads(resp.content)
         except Exception as e:
             logger.error(f"[Confluence] get_page failed for {content_id}: {e}")
             return None
@@ -7,6 +7,7 @@ import os
 import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime, timedelta
 from openai import OpenAI
 import re
 from dotenv import load_dotenv
@@ -59,6 +60,82 @@ class IntelligentAIEngine:
         if len(self.conversation_context) > 10:
             self.conversation_context.pop(0)
     
+    def add_contexts(self, user_queries: List[str]):
+        """Add several query-only context entries, trimming once at the end"""
+        self.conversation_context.extend(
+            {"user_query": query, "jql": "", "result_count": 0, "response": "", "timestamp": "now"}
+            for query in user_queries
+        )
+        
+        # Keep only last 10 interactions
+        if len(self.conversation_context) > 10:
+            del self.conversation_context[:-10]
+    
+    def clear_context(self):
+        """Drop accumulated conversation context"""
+        self.conversation_context.clear()
+    
+    def generate_predictive_analysis(self, user_query: str, historical_series: Dict[str, Any], horizon_days: int = 14) -> Dict[str, Any]:
+        """Forecast issue activity over the next horizon from daily update counts, with an AI narrative when OpenAI is available"""
+        daily_updates = historical_series.get('daily_updates') or {}
+        
+        # Fill days without updates so the trend isn't skewed by gaps
+        counts = []
+        if daily_updates:
+            days = sorted(datetime.strptime(day, "%Y-%m-%d").date() for day in daily_updates)
+            span = (days[-1] - days[0]).days + 1
+            counts = [daily_updates.get((days[0] + timedelta(days=offset)).isoformat(), 0) for offset in range(span)]
+        
+        # Least-squares slope of updates per day
+        n = len(counts)
+        x_mean = (n - 1) / 2
+        daily_average = sum(counts) / n if n else 0.0
+        slope = 0.0
+        if n > 1:
+            slope = sum((x - x_mean) * (y - daily_average) for x, y in enumerate(counts)) / sum((x - x_mean) ** 2 for x in range(n))
+        
+        projected = sum(max(0.0, daily_average + slope * (n - 1 + step - x_mean)) for step in range(1, horizon_days + 1))
+        if abs(slope) * horizon_days < 0.1 * max(daily_average, 1.0):
+            trend = "stable"
+        else:
+            trend = "increasing" if slope > 0 else "decreasing"
+        
+        forecast = {
+            "trend": trend,
+            "daily_average": round(daily_average, 2),
+            "daily_change": round(slope, 3),
+            "projected_updates": round(projected),
+            "horizon_days": horizon_days,
+            "days_observed": n
+        }
+        forecast["summary"] = self._predictive_summary(user_query, historical_series, forecast)
+        return forecast
+    
+    def _predictive_summary(self, user_query: str, historical_series: Dict[str, Any], forecast: Dict[str, Any]) -> str:
+        """Describe a forecast in prose, via OpenAI when configured"""
+        basic = (f"Activity is {forecast['trend']}: about {forecast['daily_average']} issue updates per day over "
+                 f"{forecast['days_observed']} days, projecting roughly {forecast['projected_updates']} updates "
+                 f"in the next {forecast['horizon_days']} days.")
+        if not self.client:
+            return basic
+        
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "You are a delivery analyst. Answer briefly using only the forecast and totals given."},
+                    {"role": "user", "content": f"Question: {user_query}\nForecast: {json.dumps(forecast)}\n"
+                                                f"Status totals: {json.dumps(historical_series.get('status_counts', {}))}\n"
+                                                f"Type totals: {json.dumps(historical_series.get('type_counts', {}))}"}
+                ],
+                temperature=0.3,
+                max_tokens=400
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error(f"Predictive summary generation failed: {e}")
+            return basic
+    
     async def process_query(self, user_query: str) -> Dict[str, Any]:
         """
         Main entry point - processes user query intelligently
@@ -6,12 +6,26 @@ import os
 import json
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Set
 import httpx
 from dataclasses import dataclass
 
+from utils.http_utils import HTTP2_AVAILABLE, HTTP_LIMITS, decode_json_response
+
 logger = logging.getLogger(__name__)
 
+# Upstream search concurrency and short-lived result cache
+SEARCH_CONCURRENCY = 10
+SEARCH_CACHE_TTL = 30
+SEARCH_CACHE_MAX_ENTRIES = 256
+
+def _copy_search_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a shared search result deep enough that callers can annotate issues without touching the cache"""
+    if not data or 'issues' not in data:
+        return dict(data) if data else data
+    return {**data, 'issues': [dict(issue) for issue in data['issues']]}
+
 @dataclass
 class JiraConfig:
     base_url: str
@@ -28,11 +42,14 @@ class JiraClient:
         self.cfg = config
         self._client = None
         self._headers = None
+        self._search_semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self._result_cache: Dict[tuple, tuple] = {}
         
     async def initialize(self):
         """Initialize the HTTP client"""
         if not self._client:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = httpx.AsyncClient(timeout=30.0, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE)
             self._headers = {
                 'Authorization': f'Basic {self._get_auth_string()}',
                 'Accept': 'application/json',
@@ -49,49 +66,85 @@ class JiraClient:
         """Build full URL"""
         return f"{self.cfg.base_url.rstrip('/')}{path}"
     
-    async def search(self, jql: str, max_results: int = 50, fields=None, start_at: int = 0, expand=None):
+    async def search(self, jql: str, max_results: int = 50, fields=None, start_at: int = 0, expand=None, next_page_token: Optional[str] = None):
         """
-        Search issues using the correct Jira REST API v3 endpoints
+        Search issues, sharing identical in-flight requests and recent results
         """
         if not self._client:
             await self.initialize()
 
-        # Use the new API v3 search/jql endpoint with GET
+        if isinstance(fields, (list, tuple)):
+            fields = ",".join(fields)
+        key = (jql, max_results, fields, start_at, expand, next_page_token)
+
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                return _copy_search_result(cached[1])
+            del self._result_cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._search_upstream(jql, max_results, fields, start_at, expand, next_page_token))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+
         try:
-            url = f"{self.cfg.base_url.rstrip('/')}/rest/api/3/search/jql"
-            params = {
-                "jql": jql,
-                "maxResults": max_results,
-                "startAt": start_at
-            }
-            # Always specify fields to ensure we get results
-            if fields:
-                params["fields"] = ",".join(fields) if isinstance(fields, list) else fields
-            else:
-                # Use a comprehensive set of default fields
-                params["fields"] = "key,summary,status,issuetype,assignee,project,created,updated,priority,description"
-            if expand:
-                params["expand"] = expand
-                
-            resp = await self._client.get(url, params=params, headers=self._headers)
-            
-            if resp.status_code == 200:
-                data = resp.json()
-                logger.info(f"Successfully used API v3 search/jql: {len(data.get('issues', []))} issues found")
-                logger.info(f"Jira response structure: total={data.get('total')}, startAt={data.get('startAt')}, maxResults={data.get('maxResults')}")
-                return data
-            else:
-                logger.error(f"[Jira] API v3 search/jql failed {resp.status_code}: {resp.text}")
-                return {"issues": [], "total": 0}
-                
+            data = await asyncio.shield(task)
         except Exception as e:
             logger.error(f"[Jira] API v3 search/jql failed: {e}")
             return {"issues": [], "total": 0}
+
+        if len(self._result_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+            self._result_cache.pop(next(iter(self._result_cache)))
+        self._result_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL, data)
+        return _copy_search_result(data)
+
+    async def _search_upstream(self, jql: str, max_results: int, fields: Optional[str], start_at: int, expand, next_page_token: Optional[str] = None):
+        """Call the API v3 search/jql endpoint, raising on failure"""
+        # Use the new API v3 search/jql endpoint with GET
+        url = f"{self.cfg.base_url.rstrip('/')}/rest/api/3/search/jql"
+        params = {
+            "jql": jql,
+            "maxResults": max_results,
+            "startAt": start_at
+        }
+        # Always specify fields to ensure we get results
+        if fields:
+            params["fields"] = fields
+        else:
+            # Use a comprehensive set of default fields
+            params["fields"] = "key,summary,status,issuetype,assignee,project,created,updated,priority,description"
+        if expand:
+            params["expand"] = expand
+        if next_page_token:
+            # Cursor pagination; the server resumes where the previous page ended
+            params["nextPageToken"] = next_page_token
+
+        async with self._search_semaphore:
+            resp = await self._client.get(url, params=params, headers=self._headers)
+
+        if resp.status_code != 200:
+            raise RuntimeError(f"{resp.status_code}: {resp.text}")
+
+        data = await decode_json_response(resp)
+        logger.info(f"Successfully used API v3 search/jql: {len(data.get('issues', []))} issues found")
+        logger.info(f"Jira response structure: total={data.get('total')}, startAt={data.get('startAt')}, maxResults={data.get('maxResults')}")
+        return data
+    
+    def clear_cache(self):
+        """Forget recently cached search results"""
+        self._result_cache.clear()
+    
+    async def search_issues(self, jql: str, max_results: int = 50, fields=None) -> List[Dict[str, Any]]:
+        """Search issues and return only the issue list"""
+        result = await self.search(jql, max_results=max_results, fields=fields)
+        return result.get('issues', [])
     
     async def count(self, jql: str) -> int:
         """Get count of issues matching JQL"""
         try:
-            result = await self.search(jql, max_results=1)
+            result = await self.search(jql, max_results=1, fields=['key'])
             if isinstance(result, dict):
                 return result.get('total', 0)
             return 0
@@ -99,6 +152,26 @@ class JiraClient:
             logger.error(f"Count query failed: {e}")
             return 0
     
+    async def get_assignees_for_project(self, project_key: str, max_pages: int = 10) -> Set[str]:
+        """Get display names of everyone assigned at least one issue in a project"""
+        jql = f'project = "{project_key}" AND assignee is not EMPTY'
+        assignees = set()
+        start_at, token = 0, None
+        for _ in range(max_pages):
+            data = await self.search(jql, max_results=100, fields=['assignee'], start_at=start_at, next_page_token=token)
+            issues = data.get('issues', [])
+            for issue in issues:
+                name = ((issue.get('fields') or {}).get('assignee') or {}).get('displayName')
+                if name:
+                    assignees.add(name)
+            
+            # Follow the cursor when offered, otherwise fall back to offsets
+            token = data.get('nextPageToken')
+            start_at += len(issues)
+            if data.get('isLast') or not issues or (not token and start_at >= data.get('total', 0)):
+                break
+        return assignees
+    
     async def get_projects(self) -> List[Dict[str, Any]]:
         """Get all projects using the correct project endpoint"""
         try:
@@ -124,6 +197,24 @@ class JiraClient:
             logger.error(f"Failed to get project keys: {e}")
             return []
     
+    async def get_current_sprint(self) -> Optional[Dict[str, Any]]:
+        """Get the active sprint for the configured board, if any"""
+        if not self.cfg.board_id:
+            return None
+        url = self._url(f"/rest/agile/1.0/board/{self.cfg.board_id}/sprint?state=active")
+        response = await self._get_with_retry(url)
+        sprints = (await decode_json_response(response)).get('values', [])
+        return sprints[0] if sprints else None
+    
+    async def preconnect(self, timeout: float = 5.0) -> None:
+        """Open a pooled connection (TCP/TLS, HTTP/2 session) ahead of the first real request"""
+        if not self._client:
+            await self.initialize()
+        try:
+            await self._client.head(self.cfg.base_url, headers=self._headers, timeout=timeout)
+        except Exception as e:
+            logger.debug(f"[Jira] preconnect failed: {e}")
+    
     async def _get_with_retry(self, url: str, max_retries: int = 3) -> httpx.Response:
         """Get with retry logic"""
         if not self._client:
@@ -145,3 +236,5 @@ class JiraClient:
         if self._client:
             await self._client.aclose()
             self._client = None
+        self._inflight.clear()
+        self._result_cache.clear()
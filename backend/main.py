@@ -1,16 +1,23 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse, FileResponse, Response
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import os
 import tempfile
 import json
 import io
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 import sys
+import time
 import asyncio
+import functools
+import heapq
+import itertools
+import uuid
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
 # Optional imports with fallback
@@ -29,6 +36,12 @@ try:
 except ImportError:
     PPTX_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import from current backend directory
 from jira_client import JiraClient
 from auth import JiraConfig
@@ -36,13 +49,74 @@ from confluence_client import ConfluenceConfig
 from intelligent_ai_engine import IntelligentAIEngine
 from analytics_engine import AdvancedAnalyticsEngine
 from enhanced_jql_processor import EnhancedJQLProcessor, ResponseFormat
-from advanced_chatbot import AdvancedChatbotEngine, QueryIntent
+from advanced_chatbot import AdvancedChatbotEngine, QueryIntent, SPRINT_HEALTH_QUERY, TEAM_PERFORMANCE_QUERY
+from utils.metrics_utils import HEALTH_LABELS, score_projects
 import re
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared JQL templates and field projections
+_JQL_ALL = "project is not EMPTY"
+_JQL_RECENT = "project is not EMPTY AND updated >= -90d ORDER BY updated DESC"
+_ANALYTICS_FIELDS = ("summary", "status", "assignee", "issuetype", "project")
+_PREDICTIVE_FIELDS = ("updated", "status", "issuetype")
+_DETAIL_FIELDS = ("summary", "status", "assignee", "project", "issuetype", "priority", "labels", "created", "updated")
+_DASHBOARD_FIELDS = ("status", "project", "assignee")
+_SPRINT_FIELDS = ("status",)
+_METRICS_FIELDS = ("key", "summary", "status", "assignee", "priority", "issuetype", "project", "created", "updated",
+                   "description", "reporter", "labels", "components", "fixVersions", "duedate", "customfield_10016")
+_PERFORMERS_FIELDS = ("status", "assignee", "issuetype", "customfield_10016")
+_ACTIVITY_FIELDS = ("summary", "status", "assignee", "updated", "priority")
+_JQL_ASSIGNED = "assignee is not EMPTY"
+
+# Status names treated as completed or blocked work
+DONE_STATUSES = frozenset({"Done", "Closed", "Resolved"})
+BLOCKED_STATUSES = frozenset({"Blocked", "Waiting"})
+# Jira status category for finished work, and names used when categories are missing
+DONE_CATEGORY = "Done"
+RESOLVED_STATUSES = frozenset({"Done", "Resolved", "Closed", "Completed"})
+# Statuses shown as finished ("success") in the recent activity feed
+_TERMINAL_STATUSES = frozenset({"Done", "Resolved"})
+# Pre-serialized activity feed body for when neither integration is configured
+_EMPTY_ACTIVITIES_BODY = b'{"success":true,"activities":[]}'
+
+# Shared read-only default for missing nested Jira fields; never mutate
+_EMPTY_DICT = {}
+
+# Leadership dashboard cache settings
+DASHBOARD_CACHE_TTL = 60  # seconds
+DASHBOARD_CACHE_MAX_ENTRIES = 32
+DASHBOARD_JOB_MAX_ENTRIES = 64
+EXPORT_JOB_MAX_ENTRIES = 64
+
+# Jira metrics cache lifetime
+METRICS_CACHE_TTL = 60  # seconds
+
+# Recent activities: served fresh for 30s, then stale (while refreshing in the background) up to 120s
+ACTIVITIES_CACHE_FRESH = 30  # seconds
+ACTIVITIES_CACHE_STALE = 120  # seconds
+ACTIVITIES_FETCH_TIMEOUT = 3.0  # seconds; slower sources are left out of the feed
+ACTIVITIES_PREFETCH_DELAY = 20  # seconds after serving, so polling clients keep hitting a fresh cache
+ACTIVITIES_CACHE_MAX_ENTRIES = 32
+
+# Jira metrics pagination: API v3 caps pages at 100 issues
+METRICS_PAGE_SIZE = 100
+METRICS_MAX_PAGES = 50  # 5,000 issues should be enough for most workspaces
+METRICS_PAGE_CONCURRENCY = 8
+
+# Confluence page-detail lookups in flight at once (keeps bursts under rate limits)
+CONFLUENCE_DETAIL_CONCURRENCY = 8
+
+# Export streaming
+EXPORT_SPOOL_MAX_BYTES = 1024 * 1024  # spill larger exports to disk
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Rendered exports are kept on disk and served with FileResponse
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), "exports")
+EXPORT_FILE_MAX_ENTRIES = 64
+
 # Application state
 class AppState:
     def __init__(self):
@@ -53,14 +127,30 @@ class AppState:
         self.confluence_configured = False
         self.confluence_client = None
         self.confluence_config = None
-        self.messages = []
-        self.export_files = {}
+        self.export_files = OrderedDict()  # filename -> path under EXPORT_DIR
         self.ai_engine = None
         self.query_processor = None
         self.analytics_engine = None
         self.enhanced_jql_processor = None
         self.advanced_chatbot = None
         self.max_messages = 1000  # Keep last 1000 messages
+        self.messages = deque(maxlen=self.max_messages)
+        self.message_ids = itertools.count(1)
+        self._engine_lock = asyncio.Lock()
+        # Precomputed status responses, rebuilt on (dis)connect
+        self.jira_status_snapshot = {"configured": False, "board_id": None, "config": None}
+        self.confluence_status_snapshot = {"configured": False, "config": None}
+        self._last_iso = (0, "")  # (epoch second, ISO string) for health checks
+        self.dashboard_cache = OrderedDict()  # project_filter -> (computed_at, metrics)
+        self.dashboard_jobs = OrderedDict()  # job_id -> job status/result
+        self.metrics_cache = {}  # project key -> (computed_at, metrics)
+        self.metrics_cache_stats = {"hits": 0, "misses": 0}
+        self.export_jobs = OrderedDict()  # job_id -> export job status/result
+        self.activities_cache = OrderedDict()  # project key -> (computed_at, serialized response body)
+        self.activities_refresh = {}  # project key -> in-flight background refresh task
+        self.activities_prefetch = {}  # project key -> pending delayed prefetch task
+        self.activities_locks = {}  # project key -> [lock, requests holding or awaiting it]
+        self.background_tasks = set()  # strong refs so running tasks aren't collected
 
 app_state = AppState()
 
@@ -83,6 +173,33 @@ def create_success_response(data: Any = None, message: str = "Success") -> Dict[
         response["data"] = data
     return response
 
+def _status_of(issue: Dict[str, Any]) -> str:
+    """Status name of a raw Jira issue"""
+    fields = issue.get("fields")
+    return (fields.get("status") or _EMPTY_DICT).get("name", "Unknown") if fields else "Unknown"
+
+def _type_of(issue: Dict[str, Any]) -> str:
+    """Issue type name of a raw Jira issue"""
+    fields = issue.get("fields")
+    return (fields.get("issuetype") or _EMPTY_DICT).get("name", "Unknown") if fields else "Unknown"
+
+def _priority_of(issue: Dict[str, Any]) -> str:
+    """Priority name of a raw Jira issue"""
+    fields = issue.get("fields")
+    return (fields.get("priority") or _EMPTY_DICT).get("name", "Unknown") if fields else "Unknown"
+
+def _project_of(issue: Dict[str, Any]) -> str:
+    """Project key of a raw Jira issue"""
+    fields = issue.get("fields")
+    return (fields.get("project") or _EMPTY_DICT).get("key", "Unknown") if fields else "Unknown"
+
+def _assignee_of(issue: Dict[str, Any]) -> Optional[str]:
+    """Assignee display name of a raw Jira issue, or None when unassigned"""
+    fields = issue.get("fields")
+    assignee = fields.get("assignee") if fields else None
+    return assignee.get("displayName", "Unassigned") if assignee else None
+
+@functools.lru_cache(maxsize=128)
 def mask_email(email: str) -> str:
     """Mask email address for security"""
     if not email or "@" not in email:
@@ -98,21 +215,155 @@ def mask_email(email: str) -> str:
 
 def manage_message_history(app_state: AppState, message: Dict[str, Any]) -> None:
     """Manage message history to prevent memory bloat"""
+    # The deque is bounded, so the oldest message drops off automatically
     app_state.messages.append(message)
-    
-    # Keep only the last max_messages
-    if len(app_state.messages) > app_state.max_messages:
-        app_state.messages = app_state.messages[-app_state.max_messages:]
+
+def current_iso_timestamp() -> str:
+    """Return an ISO timestamp, recomputed at most once per second"""
+    now_s = int(time.time())
+    cached_s, cached_iso = app_state._last_iso
+    if now_s != cached_s:
+        cached_iso = datetime.fromtimestamp(now_s).isoformat()
+        app_state._last_iso = (now_s, cached_iso)
+    return cached_iso
+
+def _json_bytes(content: Any) -> bytes:
+    """Serialize plain JSON content to bytes, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(content).encode()
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an Atlassian ISO timestamp into an aware datetime (UTC when no offset is given); memoized since the same pages recur across requests"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def export_timestamp() -> str:
+    """Timestamp suffix used in export filenames"""
+    return time.strftime("%Y%m%d_%H%M%S")
+
+def refresh_jira_status_snapshot() -> None:
+    """Rebuild the cached Jira status response from current state"""
+    app_state.jira_status_snapshot = {
+        "configured": app_state.jira_configured,
+        "board_id": app_state.jira_board_id,
+        "config": {
+            "url": app_state.jira_config.base_url,
+            "email": mask_email(app_state.jira_config.email)
+        } if app_state.jira_config else None
+    }
+
+def refresh_confluence_status_snapshot() -> None:
+    """Rebuild the cached Confluence status response from current state"""
+    app_state.confluence_status_snapshot = {
+        "configured": app_state.confluence_configured,
+        "config": {
+            "url": app_state.confluence_config.base_url,
+            "email": mask_email(app_state.confluence_config.email)
+        } if app_state.confluence_config else None
+    }
+
+def get_cached_dashboard(project_filter: str) -> Optional[Dict[str, Any]]:
+    """Return cached dashboard metrics for a filter if still fresh"""
+    entry = app_state.dashboard_cache.get(project_filter)
+    if entry is None:
+        return None
+    computed_at, metrics = entry
+    if time.monotonic() - computed_at >= DASHBOARD_CACHE_TTL:
+        del app_state.dashboard_cache[project_filter]
+        return None
+    app_state.dashboard_cache.move_to_end(project_filter)
+    return metrics
+
+def store_dashboard(project_filter: str, metrics: Dict[str, Any]) -> None:
+    """Cache dashboard metrics, evicting the least recently used filter"""
+    app_state.dashboard_cache[project_filter] = (time.monotonic(), metrics)
+    app_state.dashboard_cache.move_to_end(project_filter)
+    while len(app_state.dashboard_cache) > DASHBOARD_CACHE_MAX_ENTRIES:
+        app_state.dashboard_cache.popitem(last=False)
+
+async def _build_engines(analytics: bool = False, chat: bool = False) -> None:
+    """Create the Jira HTTP client and any missing shared engines exactly once, under the engine lock"""
+    async with app_state._engine_lock:
+        if chat and not app_state.jira_client._client:
+            logger.info("🔍 Initializing Jira client...")
+            await app_state.jira_client.initialize()
+        if app_state.ai_engine is None:
+            app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
+        if analytics and app_state.analytics_engine is None:
+            app_state.analytics_engine = AdvancedAnalyticsEngine(app_state.ai_engine, app_state.jira_client)
+        if chat and app_state.enhanced_jql_processor is None:
+            app_state.enhanced_jql_processor = EnhancedJQLProcessor(app_state.jira_client, app_state.ai_engine)
+        if chat and app_state.advanced_chatbot is None:
+            app_state.advanced_chatbot = AdvancedChatbotEngine(app_state.jira_client)
+
+async def _ensure_engines() -> None:
+    """Lazily create the shared AI and analytics engines exactly once"""
+    if app_state.ai_engine is None or app_state.analytics_engine is None:
+        await _build_engines(analytics=True)
+
+async def _ensure_chat_stack() -> Tuple[IntelligentAIEngine, EnhancedJQLProcessor, AdvancedChatbotEngine]:
+    """Initialize the Jira client and chat engines once, returning the shared instances"""
+    if not (app_state.jira_client._client and app_state.ai_engine and app_state.enhanced_jql_processor and app_state.advanced_chatbot):
+        await _build_engines(chat=True)
+    return app_state.ai_engine, app_state.enhanced_jql_processor, app_state.advanced_chatbot
+
+def reset_engines() -> None:
+    """Drop engines bound to the previous Jira/Confluence clients so they are rebuilt on next use"""
+    app_state.ai_engine = None
+    app_state.analytics_engine = None
+    app_state.enhanced_jql_processor = None
+    app_state.advanced_chatbot = None
+
+async def warm_chat_stack() -> None:
+    """Build the chat engines ahead of the first chat request"""
+    if not app_state.jira_client:
+        return
+    try:
+        await _ensure_chat_stack()
+        logger.info("Chat engines warmed")
+    except Exception as e:
+        logger.warning(f"Chat engine warm-up failed, engines will be built on first use: {e}")
+
+async def warm_connection_pools() -> None:
+    """Open pooled connections to the configured Jira/Confluence hosts so the first request skips the handshakes"""
+    clients = [client for client in (app_state.jira_client, app_state.confluence_client) if client]
+    if clients:
+        await asyncio.gather(*(client.preconnect() for client in clients))
+
+async def warm_up() -> None:
+    """Warm the HTTP connection pools and the chat engines"""
+    await asyncio.gather(warm_connection_pools(), warm_chat_stack())
+
+def schedule_warmup() -> None:
+    """Warm connection pools and chat engines in the background without delaying the caller"""
+    task = asyncio.create_task(warm_up())
+    app_state.background_tasks.add(task)
+    task.add_done_callback(app_state.background_tasks.discard)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("🚀 Starting Leadership Management Tool API")
+    await warm_up()
     yield
     logger.info("🛑 Shutting down Leadership Management Tool API")
+    # Release pooled keep-alive connections
+    for client in (app_state.jira_client, app_state.confluence_client):
+        if client:
+            await client.close()
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized with orjson, including numpy scalars and arrays"""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+DefaultResponse = FastJSONResponse if ORJSON_AVAILABLE else JSONResponse
 
 app = FastAPI(
     title="Leadership Management Tool API", 
+    default_response_class=DefaultResponse,
     version="1.0.0", 
     description="AI-powered leadership analytics and project management insights",
     lifespan=lifespan,
@@ -162,6 +413,28 @@ class ChatRequest(BaseModel):
     projectContext: Optional[str] = None
     cachedProjects: Optional[Dict[str, Any]] = None
 
+# Response rows for the blockers endpoint
+@dataclass(slots=True)
+class BlockedIssue:
+    key: str
+    summary: str
+    status: str
+    assignee: str
+    project: str
+    created: str
+    updated: str
+    url: str
+
+@dataclass(slots=True)
+class FlaggedIssue:
+    key: str
+    summary: str
+    priority: str
+    labels: List[str]
+    assignee: str
+    project: str
+    url: str
+
 # Helper functions
 async def handle_jira_question(message: str, jira_client: JiraClient) -> str:
     """Handle Jira-related questions with intelligent parsing"""
@@ -538,7 +811,7 @@ async def search_by_assignee(message: str, jira_client: JiraClient) -> str:
                 type_counts[issue_type] = type_counts.get(issue_type, 0) + 1
                 
                 # Categorize by status
-                if status in ['Done', 'Closed', 'Resolved']:
+                if status in DONE_STATUSES:
                     done_tickets.append(issue)
                 elif status in ['In Progress', 'Active', 'Open']:
                     in_progress_tickets.append(issue)
@@ -632,7 +905,7 @@ async def get_project_info(jira_client: JiraClient) -> str:
 async def get_sprint_info(jira_client: JiraClient) -> str:
     """Get current sprint information"""
     try:
-        current_sprint = jira_client.get_current_sprint()
+        current_sprint = await jira_client.get_current_sprint()
         if current_sprint:
             return f"""Here's your current sprint info:
 
@@ -760,7 +1033,7 @@ async def get_issue_type_info(message: str, jira_client: JiraClient) -> str:
 async def get_general_analytics(jira_client: JiraClient) -> str:
     """Get general analytics and summary"""
     try:
-        result = await jira_client.search("project is not EMPTY", max_results=1000)
+        result = await jira_client.search(_JQL_ALL, max_results=1000, fields=_ANALYTICS_FIELDS)
         issues = result.get('issues', [])
         
         # Calculate statistics
@@ -1033,7 +1306,7 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": current_iso_timestamp()}
 
 @app.post("/api/jira/configure")
 async def configure_jira(config: JiraConfigRequest):
@@ -1067,6 +1340,10 @@ async def configure_jira(config: JiraConfigRequest):
         except Exception as e:
             logger.warning(f"Could not get projects, but connection may still work: {e}")
         
+        # Release the previous client's connection pool before replacing it
+        if app_state.jira_client and app_state.jira_client is not jira_client:
+            await app_state.jira_client.close()
+        
         # Store configuration
         app_state.jira_configured = True
         app_state.jira_client = jira_client
@@ -1096,6 +1373,10 @@ async def configure_jira(config: JiraConfigRequest):
             confluence_client = ConfluenceClient(confluence_config)
             await confluence_client.initialize()
             
+            # Release the previous client's connection pool before replacing it
+            if app_state.confluence_client and app_state.confluence_client is not confluence_client:
+                await app_state.confluence_client.close()
+            
             app_state.confluence_config = confluence_config
             app_state.confluence_client = confluence_client
             app_state.confluence_configured = True
@@ -1106,6 +1387,14 @@ async def configure_jira(config: JiraConfigRequest):
             logger.warning(f"Confluence URL attempted: {confluence_url if 'confluence_url' in locals() else 'N/A'}")
             # Don't fail the Jira configuration if Confluence fails
         
+        app_state.dashboard_cache.clear()
+        app_state.metrics_cache.clear()
+        app_state.activities_cache.clear()
+        reset_engines()
+        refresh_jira_status_snapshot()
+        refresh_confluence_status_snapshot()
+        schedule_warmup()
+        
         return {
             "success": True,
             "message": "Jira configured successfully",
@@ -1132,6 +1421,11 @@ async def disconnect_jira():
         app_state.jira_client = None
         app_state.jira_config = None
         app_state.jira_board_id = None
+        app_state.dashboard_cache.clear()
+        app_state.metrics_cache.clear()
+        app_state.activities_cache.clear()
+        reset_engines()
+        refresh_jira_status_snapshot()
         
         return {
             "success": True,
@@ -1144,25 +1438,12 @@ async def disconnect_jira():
 @app.get("/api/jira/status", tags=["JIRA"], summary="Get JIRA Connection Status")
 async def get_jira_status():
     """Get Jira connection status"""
-    return {
-        "configured": app_state.jira_configured,
-        "board_id": app_state.jira_board_id,
-        "config": {
-            "url": app_state.jira_config.base_url if app_state.jira_config else None,
-            "email": mask_email(app_state.jira_config.email) if app_state.jira_config else None
-        } if app_state.jira_config else None
-    }
+    return app_state.jira_status_snapshot
 
 @app.get("/api/confluence/status", tags=["CONFLUENCE"], summary="Get Confluence Connection Status")
 async def get_confluence_status():
     """Get Confluence connection status"""
-    return {
-        "configured": app_state.confluence_configured,
-        "config": {
-            "url": app_state.confluence_config.base_url if app_state.confluence_config else None,
-            "email": mask_email(app_state.confluence_config.email) if app_state.confluence_config else None
-        } if app_state.confluence_config else None
-    }
+    return app_state.confluence_status_snapshot
 
 @app.post("/api/confluence/configure", tags=["CONFLUENCE"], summary="Configure Confluence Connection")
 async def configure_confluence(config: dict):
@@ -1181,7 +1462,15 @@ async def configure_confluence(config: dict):
         
         # Initialize Confluence client
         from confluence_client import ConfluenceClient
-        app_state.confluence_client = ConfluenceClient(confluence_config)
+        confluence_client = ConfluenceClient(confluence_config)
+        
+        # Release the previous client's connection pool before replacing it
+        if app_state.confluence_client and app_state.confluence_client is not confluence_client:
+            await app_state.confluence_client.close()
+        app_state.confluence_client = confluence_client
+        reset_engines()
+        refresh_confluence_status_snapshot()
+        schedule_warmup()
         
         return {
             "success": True,
@@ -1236,11 +1525,7 @@ async def get_jira_analytics():
         raise HTTPException(status_code=400, detail="Jira not configured")
     
     try:
-        # Initialize analytics engine if not already done
-        if not app_state.analytics_engine:
-            if not app_state.ai_engine:
-                app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-            app_state.analytics_engine = AdvancedAnalyticsEngine(app_state.ai_engine, app_state.jira_client)
+        await _ensure_engines()
         
         # Generate comprehensive analytics
         analytics = await app_state.analytics_engine.generate_comprehensive_analytics()
@@ -1253,6 +1538,26 @@ async def get_jira_analytics():
         logger.error(f"Advanced analytics error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def summarize_historical_issues(issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Collapse raw issues into daily update counts plus status/type totals"""
+    daily_updates = Counter()
+    status_counts = Counter()
+    type_counts = Counter()
+    
+    for issue in issues:
+        updated = (issue.get('fields') or _EMPTY_DICT).get('updated')
+        if updated:
+            daily_updates[updated[:10]] += 1
+        status_counts[_status_of(issue)] += 1
+        type_counts[_type_of(issue)] += 1
+    
+    return {
+        "total_issues": len(issues),
+        "daily_updates": dict(sorted(daily_updates.items())),
+        "status_counts": dict(status_counts),
+        "type_counts": dict(type_counts)
+    }
+
 @app.post("/api/jira/predictive-analysis")
 async def get_predictive_analysis(request: Dict[str, Any]):
     """Get predictive analysis and forecasting"""
@@ -1262,23 +1567,19 @@ async def get_predictive_analysis(request: Dict[str, Any]):
     try:
         query = request.get("query", "What are the trends and predictions for our team performance?")
         
-        # Initialize AI components if not already done
-        if not app_state.ai_engine:
-            app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-        if not app_state.analytics_engine:
-            app_state.analytics_engine = AdvancedAnalyticsEngine(app_state.ai_engine, app_state.jira_client)
+        await _ensure_engines()
         
         # Get historical data for prediction
-        historical_jql = "project is not EMPTY AND updated >= -90d ORDER BY updated DESC"
-        historical_data = await app_state.jira_client.search(historical_jql, max_results=1000)
+        historical_issues = await fetch_all_issues(_JQL_RECENT, _PREDICTIVE_FIELDS)
+        historical_series = summarize_historical_issues(historical_issues)
         
-        # Generate prediction
-        prediction = app_state.ai_engine.generate_predictive_analysis(query, historical_data)
+        # Generate prediction; the optional OpenAI narrative is a blocking call
+        prediction = await asyncio.to_thread(app_state.ai_engine.generate_predictive_analysis, query, historical_series)
         
         return {
             "success": True,
             "prediction": prediction,
-            "data_points": len(historical_data.get('issues', [])),
+            "data_points": historical_series["total_issues"],
             "timeframe": "next_2_weeks"
         }
     except Exception as e:
@@ -1292,11 +1593,7 @@ async def get_anomaly_detection():
         raise HTTPException(status_code=400, detail="Jira not configured")
     
     try:
-        # Initialize analytics engine if not already done
-        if not app_state.analytics_engine:
-            if not app_state.ai_engine:
-                app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-            app_state.analytics_engine = AdvancedAnalyticsEngine(app_state.ai_engine, app_state.jira_client)
+        await _ensure_engines()
         
         # Get current analytics
         analytics = await app_state.analytics_engine.generate_comprehensive_analytics()
@@ -1324,11 +1621,7 @@ async def get_intelligent_recommendations(request: Dict[str, Any]):
     try:
         query = request.get("query", "What recommendations do you have for improving our team performance?")
         
-        # Initialize AI components if not already done
-        if not app_state.ai_engine:
-            app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-        if not app_state.analytics_engine:
-            app_state.analytics_engine = AdvancedAnalyticsEngine(app_state.ai_engine, app_state.jira_client)
+        await _ensure_engines()
         
         # Get comprehensive analytics
         analytics = await app_state.analytics_engine.generate_comprehensive_analytics()
@@ -1357,11 +1650,7 @@ async def get_ai_insights(request: Dict[str, Any]):
         insight_type = request.get("type", "general")
         jira_client = app_state.jira_client
         
-        # Get analytics data directly from analytics engine
-        if not app_state.analytics_engine:
-            if not app_state.ai_engine:
-                app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-            app_state.analytics_engine = AdvancedAnalyticsEngine(app_state.ai_engine, app_state.jira_client)
+        await _ensure_engines()
         
         analytics = await app_state.analytics_engine.generate_comprehensive_analytics()
         
@@ -1396,7 +1685,7 @@ async def export_jira_analytics(request: Dict[str, Any]):
                 "success": True,
                 "data": analytics,
                 "format": "json",
-                "filename": f"jira_analytics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                "filename": f"jira_analytics_{export_timestamp()}.json"
             }
         elif export_format == "csv":
             # Convert to CSV format
@@ -1405,7 +1694,7 @@ async def export_jira_analytics(request: Dict[str, Any]):
                 "success": True,
                 "data": csv_data,
                 "format": "csv",
-                "filename": f"jira_analytics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                "filename": f"jira_analytics_{export_timestamp()}.csv"
             }
         else:
             raise HTTPException(status_code=400, detail="Unsupported export format")
@@ -1467,36 +1756,22 @@ async def get_project_details(request: dict):
             return {"error": f"Project {project_key} not found"}
         
         # Get project issues
-        issues = await app_state.jira_client.search_issues(f"project = {project_key}")
+        issues = await app_state.jira_client.search_issues(f"project = {project_key}", fields=_DETAIL_FIELDS)
         
         # Get project statistics
+        issue_types = Counter(map(_type_of, issues))
+        assignees = Counter(filter(None, map(_assignee_of, issues)))
+        statuses = Counter(map(_status_of, issues))
+        priorities = Counter(map(_priority_of, issues))
+        
         stats = {
             "total_issues": len(issues),
-            "issue_types": {},
-            "assignees": {},
-            "statuses": {},
-            "priorities": {}
+            "issue_types": dict(issue_types),
+            "assignees": dict(assignees),
+            "statuses": dict(statuses),
+            "priorities": dict(priorities)
         }
         
-        for issue in issues:
-            # Count issue types
-            issue_type = issue.get("fields", {}).get("issuetype", {}).get("name", "Unknown")
-            stats["issue_types"][issue_type] = stats["issue_types"].get(issue_type, 0) + 1
-            
-            # Count assignees
-            assignee = issue.get("fields", {}).get("assignee", {})
-            if assignee:
-                assignee_name = assignee.get("displayName", "Unassigned")
-                stats["assignees"][assignee_name] = stats["assignees"].get(assignee_name, 0) + 1
-            
-            # Count statuses
-            status = issue.get("fields", {}).get("status", {}).get("name", "Unknown")
-            stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
-            
-            # Count priorities
-            priority = issue.get("fields", {}).get("priority", {}).get("name", "Unknown")
-            stats["priorities"][priority] = stats["priorities"].get(priority, 0) + 1
-        
         return {
             "project": project,
             "statistics": stats,
@@ -1507,56 +1782,45 @@ async def get_project_details(request: dict):
         logger.error(f"❌ Project details error: {e}")
         return {"error": f"Failed to get project details: {str(e)}"}
 
+def apply_chat_context(ai_engine: IntelligentAIEngine, request: ChatRequest) -> None:
+    """Load client-sent history, project context and cached projects into the AI engine"""
+    # The client sends its own history, so rebuild context from it instead of accumulating
+    if request.messages:
+        ai_engine.clear_context()
+    
+    context_entries = [msg.content for msg in request.messages[-5:]] if request.messages else []  # Last 5 messages for context
+    
+    # Add project context to AI engine
+    if request.projectContext:
+        context_entries.append(f"Project context: {request.projectContext}")
+    
+    # Add cached projects to AI engine context as one combined entry
+    if request.cachedProjects:
+        context_entries.append("Cached projects: " + "; ".join(
+            f"{project_key}: {project_data}" for project_key, project_data in request.cachedProjects.items()
+        ))
+    
+    if context_entries:
+        ai_engine.add_contexts(context_entries)
+
 @app.post("/api/chat", tags=["Chat"], summary="Chat with AI Assistant")
 async def chat_endpoint(request: ChatRequest):
     """Handle chat messages with advanced AI processing"""
     try:
         message = request.message.strip()
         
-        # Debug logging
         logger.info(f"Processing message: '{message}'")
-        logger.info(f"Jira configured: {app_state.jira_configured}")
-        logger.info(f"Jira client exists: {app_state.jira_client is not None}")
-        logger.info(f"AI Engine initialized: {app_state.ai_engine is not None}")
-        
-        # Always reinitialize AI components to ensure they have the current Jira client
-        logger.info("🔍 Initializing AI components...")
         
-        # Ensure Jira client is properly initialized
-        if app_state.jira_client and not app_state.jira_client._client:
-            logger.info("🔍 Initializing Jira client...")
-            await app_state.jira_client.initialize()
+        if not app_state.jira_client:
+            logger.warning("⚠️ Cannot create AI Engine: Jira client is not available")
+            return {"error": "Jira client is not properly configured. Please check your Jira connection."}
+        ai_engine, _, _ = await _ensure_chat_stack()
         
-        # Initialize AI components lazily (only when needed)
-        if not app_state.ai_engine:
-            logger.info("🔍 Creating AI Engine...")
-            if app_state.jira_client:
-                app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-            else:
-                logger.warning("⚠️ Cannot create AI Engine: Jira client is not available")
-                return {"error": "Jira client is not properly configured. Please check your Jira connection."}
+        apply_chat_context(ai_engine, request)
         
         # Process the message
         logger.info("🔍 Processing message with AI Engine...")
-        if not app_state.ai_engine:
-            logger.error("❌ AI Engine is not available")
-            return {"error": "AI Engine is not properly initialized. Please check your configuration."}
-        
-        # Add conversation history to AI engine context
-        if request.messages:
-            for msg in request.messages[-5:]:  # Last 5 messages for context
-                app_state.ai_engine.add_context(msg.content, "", [], "")
-        
-        # Add project context to AI engine
-        if request.projectContext:
-            app_state.ai_engine.add_context(f"Project context: {request.projectContext}", "", [], "")
-        
-        # Add cached projects to AI engine context
-        if request.cachedProjects:
-            for project_key, project_data in request.cachedProjects.items():
-                app_state.ai_engine.add_context(f"Cached project {project_key}: {project_data}", "", [], "")
-        
-        ai_result = await app_state.ai_engine.process_query(message)
+        ai_result = await ai_engine.process_query(message)
         
         # Extract the response text from the AI result
         if isinstance(ai_result, dict):
@@ -1585,17 +1849,18 @@ async def chat_endpoint(request: ChatRequest):
 @app.get("/api/messages")
 async def get_messages():
     """Get chat messages"""
-    return {"messages": app_state.messages}
+    return {"messages": list(app_state.messages)}
 
 @app.get("/api/chat/history")
 async def get_chat_history():
     """Get chat history"""
-    return {"messages": app_state.messages}
+    return {"messages": list(app_state.messages)}
 
 @app.post("/api/chat/clear")
 async def clear_chat():
     """Clear chat history"""
-    app_state.messages = []
+    app_state.messages.clear()
+    app_state.dashboard_cache.clear()
     return {"success": True, "message": "Chat cleared"}
 
 @app.post("/api/chat/enhanced", tags=["Chat"], summary="Enhanced Chat with JQL Processing")
@@ -1615,24 +1880,11 @@ async def enhanced_chat_endpoint(request: ChatRequest):
                 "metadata": {"ai_enhanced": False, "error": True}
             }
         
-        # Ensure Jira client is properly initialized
-        if app_state.jira_client and not app_state.jira_client._client:
-            logger.info("🔍 Initializing Jira client...")
-            await app_state.jira_client.initialize()
-        
-        # Initialize AI engine if needed
-        if not app_state.ai_engine:
-            logger.info("🔍 Creating AI Engine...")
-            app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-        
-        # Initialize enhanced JQL processor if needed
-        if not app_state.enhanced_jql_processor:
-            logger.info("🔍 Creating Enhanced JQL Processor...")
-            app_state.enhanced_jql_processor = EnhancedJQLProcessor(app_state.jira_client, app_state.ai_engine)
+        _, enhanced_jql_processor, _ = await _ensure_chat_stack()
         
         # Process query with enhanced JQL processor
         logger.info("🔍 About to call enhanced_jql_processor.process_query")
-        result = await app_state.enhanced_jql_processor.process_query(message, ResponseFormat.TEXT)
+        result = await enhanced_jql_processor.process_query(message, ResponseFormat.TEXT)
         logger.info(f"🔍 Enhanced JQL processor returned: {result}")
         
         # Generate response
@@ -1640,8 +1892,8 @@ async def enhanced_chat_endpoint(request: ChatRequest):
         logger.info(f"🔍 Final enhanced response: {response}")
         
         # Store message in history
-        app_state.messages.append({
-            "id": len(app_state.messages) + 1,
+        manage_message_history(app_state, {
+            "id": next(app_state.message_ids),
             "message": message,
             "response": response,
             "timestamp": datetime.now().isoformat(),
@@ -1687,29 +1939,17 @@ async def json_chat_endpoint(request: ChatRequest):
                 "metadata": {"ai_enhanced": False, "error": True}
             }
         
-        # Ensure Jira client is properly initialized
-        if app_state.jira_client and not app_state.jira_client._client:
-            logger.info("🔍 Initializing Jira client...")
-            await app_state.jira_client.initialize()
-        
-        # Initialize AI engine if needed
-        if not app_state.ai_engine:
-            logger.info("🔍 Creating AI Engine...")
-            app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-        
-        # Initialize enhanced JQL processor if needed
-        if not app_state.enhanced_jql_processor:
-            logger.info("🔍 Creating Enhanced JQL Processor...")
-            app_state.enhanced_jql_processor = EnhancedJQLProcessor(app_state.jira_client, app_state.ai_engine)
+        _, enhanced_jql_processor, _ = await _ensure_chat_stack()
         
         # Process query with enhanced JQL processor in JSON mode
         logger.info("🔍 About to call enhanced_jql_processor.process_query (JSON mode)")
-        result = await app_state.enhanced_jql_processor.process_query(message, ResponseFormat.JSON)
+        result = await enhanced_jql_processor.process_query(message, ResponseFormat.JSON)
         logger.info(f"🔍 Enhanced JQL processor returned JSON: {result}")
         
         # Parse JSON response
         try:
-            response_data = json.loads(result.get('response', '{}'))
+            raw_response = result.get('response', '{}')
+            response_data = orjson.loads(raw_response) if ORJSON_AVAILABLE else json.loads(raw_response)
         except json.JSONDecodeError:
             response_data = {"error": "Invalid JSON response", "raw_response": result.get('response', '')}
         
@@ -1742,18 +1982,22 @@ async def get_sprint_history(board_id: int):
         # Get last 3 sprints
         sprints = await app_state.jira_client.get_sprint_history(board_id, limit=3)
         
+        # Fetch all sprint issue sets concurrently
+        sprint_results = await asyncio.gather(
+            *(app_state.jira_client.search(f"sprint = {sprint['id']}", max_results=1000, fields=_SPRINT_FIELDS) for sprint in sprints),
+            return_exceptions=True
+        )
+        
         sprint_data = []
-        for sprint in sprints:
-            # Get sprint metrics
-            sprint_issues = await app_state.jira_client.search(
-                f"sprint = {sprint['id']}", 
-                max_results=1000
-            )
+        for sprint, sprint_issues in zip(sprints, sprint_results):
+            if isinstance(sprint_issues, Exception):
+                logger.warning(f"Sprint {sprint.get('id')} search failed: {sprint_issues}")
+                continue
             
             # Calculate velocity
             completed_issues = [
                 issue for issue in sprint_issues.get('issues', [])
-                if issue.get('fields', {}).get('status', {}).get('name') in ['Done', 'Closed']
+                if ((issue.get('fields') or _EMPTY_DICT).get('status') or _EMPTY_DICT).get('name') in DONE_STATUSES
             ]
             
             velocity = len(completed_issues)
@@ -1781,40 +2025,45 @@ async def get_blocked_issues():
         raise HTTPException(status_code=400, detail="Jira not configured")
     
     try:
-        # Get blocked issues
-        blocked_jql = "status = Blocked OR status = Waiting"
-        blocked_issues = await app_state.jira_client.search(blocked_jql, max_results=100)
-        
-        # Get flagged issues
-        flagged_jql = "labels = flagged OR priority = Highest"
-        flagged_issues = await app_state.jira_client.search(flagged_jql, max_results=100)
+        # Get blocked and flagged issues with one query, then split them locally; the endpoint caps
+        # pages at 100 issues, so page through the combined results rather than asking for more per page
+        combined_jql = "(status in (Blocked, Waiting)) OR (labels = flagged) OR (priority = Highest)"
+        issues = await fetch_all_issues(combined_jql, _DETAIL_FIELDS)
+        blocked_issues = [
+            i for i in issues
+            if (i['fields'].get('status') or _EMPTY_DICT).get('name') in BLOCKED_STATUSES
+        ]
+        flagged_issues = [
+            i for i in issues
+            if 'flagged' in (i['fields'].get('labels') or []) or (i['fields'].get('priority') or _EMPTY_DICT).get('name') == 'Highest'
+        ]
         
         # Process blocked issues
         blocked_data = []
-        for issue in blocked_issues.get('issues', []):
-            blocked_data.append({
-                "key": issue['key'],
-                "summary": issue['fields']['summary'],
-                "status": issue['fields']['status']['name'],
-                "assignee": issue['fields'].get('assignee', {}).get('displayName', 'Unassigned'),
-                "project": issue['fields']['project']['key'],
-                "created": issue['fields']['created'],
-                "updated": issue['fields']['updated'],
-                "url": f"{app_state.jira_config.base_url}/browse/{issue['key']}"
-            })
+        for issue in blocked_issues:
+            blocked_data.append(BlockedIssue(
+                key=issue['key'],
+                summary=issue['fields']['summary'],
+                status=issue['fields']['status']['name'],
+                assignee=(issue['fields'].get('assignee') or _EMPTY_DICT).get('displayName', 'Unassigned'),
+                project=issue['fields']['project']['key'],
+                created=issue['fields']['created'],
+                updated=issue['fields']['updated'],
+                url=f"{app_state.jira_config.base_url}/browse/{issue['key']}"
+            ))
         
         # Process flagged issues
         flagged_data = []
-        for issue in flagged_issues.get('issues', []):
-            flagged_data.append({
-                "key": issue['key'],
-                "summary": issue['fields']['summary'],
-                "priority": issue['fields'].get('priority', {}).get('name', 'Medium'),
-                "labels": [label for label in issue['fields'].get('labels', [])],
-                "assignee": issue['fields'].get('assignee', {}).get('displayName', 'Unassigned'),
-                "project": issue['fields']['project']['key'],
-                "url": f"{app_state.jira_config.base_url}/browse/{issue['key']}"
-            })
+        for issue in flagged_issues:
+            flagged_data.append(FlaggedIssue(
+                key=issue['key'],
+                summary=issue['fields']['summary'],
+                priority=(issue['fields'].get('priority') or _EMPTY_DICT).get('name', 'Medium'),
+                labels=issue['fields'].get('labels') or [],
+                assignee=(issue['fields'].get('assignee') or _EMPTY_DICT).get('displayName', 'Unassigned'),
+                project=issue['fields']['project']['key'],
+                url=f"{app_state.jira_config.base_url}/browse/{issue['key']}"
+            ))
         
         return create_success_response({
             "blocked_issues": blocked_data,
@@ -1844,19 +2093,11 @@ async def advanced_chat_endpoint(request: ChatRequest):
                 "metadata": {"ai_enhanced": False, "error": True}
             }
         
-        # Ensure Jira client is properly initialized
-        if app_state.jira_client and not app_state.jira_client._client:
-            logger.info("🔍 Initializing Jira client...")
-            await app_state.jira_client.initialize()
-        
-        # Initialize advanced chatbot if needed
-        if not app_state.advanced_chatbot:
-            logger.info("🔍 Creating Advanced Chatbot Engine...")
-            app_state.advanced_chatbot = AdvancedChatbotEngine(app_state.jira_client)
+        _, _, advanced_chatbot = await _ensure_chat_stack()
         
         # Process query with advanced chatbot
         logger.info("🔍 About to call advanced_chatbot.process_advanced_query")
-        result = await app_state.advanced_chatbot.process_advanced_query(message)
+        result = await advanced_chatbot.process_advanced_query(message)
         logger.info(f"🔍 Advanced chatbot returned: {result}")
         
         # Generate response
@@ -1864,8 +2105,8 @@ async def advanced_chat_endpoint(request: ChatRequest):
         logger.info(f"🔍 Final advanced response: {response}")
         
         # Store message in history
-        app_state.messages.append({
-            "id": len(app_state.messages) + 1,
+        manage_message_history(app_state, {
+            "id": next(app_state.message_ids),
             "message": message,
             "response": response,
             "timestamp": datetime.now().isoformat(),
@@ -1903,12 +2144,10 @@ async def get_sprint_health():
         if not app_state.jira_configured or not app_state.jira_client:
             return create_error_response("Jira not configured", "Please configure Jira first", 400)
         
-        # Initialize advanced chatbot if needed
-        if not app_state.advanced_chatbot:
-            app_state.advanced_chatbot = AdvancedChatbotEngine(app_state.jira_client)
+        _, _, advanced_chatbot = await _ensure_chat_stack()
         
         # Process sprint health query
-        result = await app_state.advanced_chatbot.process_advanced_query("What's our sprint health status?")
+        result = await advanced_chatbot.process_advanced_query(SPRINT_HEALTH_QUERY)
         
         return create_success_response({
             "health_dashboard": result.get('response', ''),
@@ -1964,6 +2203,176 @@ async def get_jira_projects():
             "error": f"Failed to fetch projects: {str(e)}"
         }
 
+async def build_dashboard_metrics(project_filter: str) -> Dict[str, Any]:
+    """Fetch issues and aggregate leadership dashboard metrics, caching the result"""
+    # Get basic Jira data
+    jql = "project is not EMPTY ORDER BY updated DESC"
+    if project_filter != 'ALL':
+        jql = f'project = "{project_filter}" ORDER BY updated DESC'
+    
+    issues_data = await app_state.jira_client.search(jql, max_results=1000, fields=_DASHBOARD_FIELDS)
+    issues = issues_data.get('issues', [])
+    
+    # Aggregate portfolio, project and assignee stats in a single pass
+    total_issues = len(issues)
+    completed_items = 0
+    contributors = set()
+    project_stats = {}
+    assignee_stats = {}
+    
+    for issue in issues:
+        status_name = _status_of(issue)
+        project_key = _project_of(issue)
+        assignee_name = _assignee_of(issue)
+        is_done = status_name in DONE_STATUSES
+        
+        if is_done:
+            completed_items += 1
+        if assignee_name is None:
+            assignee_name = 'Unassigned'
+        else:
+            contributors.add(assignee_name)
+        
+        stats = project_stats.get(project_key)
+        if stats is None:
+            stats = project_stats[project_key] = {'total': 0, 'completed': 0, 'in_progress': 0, 'blocked': 0}
+        stats['total'] += 1
+        if is_done:
+            stats['completed'] += 1
+        elif status_name == 'In Progress':
+            stats['in_progress'] += 1
+        elif status_name == 'Blocked':
+            stats['blocked'] += 1
+        
+        person = assignee_stats.get(assignee_name)
+        if person is None:
+            person = assignee_stats[assignee_name] = {'completed': 0, 'total': 0}
+        person['total'] += 1
+        if is_done:
+            person['completed'] += 1
+    
+    completion_rate = (completed_items / total_issues * 100) if total_issues > 0 else 0
+    total_projects = len(project_stats)
+    active_contributors = len(contributors)
+    
+    # Calculate project health
+    project_keys = list(project_stats)
+    health_scores, health_bands = score_projects(
+        [project_stats[p]['completed'] for p in project_keys],
+        [project_stats[p]['total'] for p in project_keys]
+    )
+    
+    project_health = {}
+    for project, health_score, band in zip(project_keys, health_scores, health_bands):
+        stats = project_stats[project]
+        project_health[project] = {
+            "name": project,
+            "health_score": round(float(health_score), 1),
+            "status": HEALTH_LABELS[band],
+            "total_issues": stats['total'],
+            "completed": stats['completed'],
+            "in_progress": stats['in_progress'],
+            "blocked": stats['blocked'],
+            "velocity_trend": "stable"  # Simplified for now
+        }
+    
+    # Calculate team performance
+    top_performers = []
+    for assignee, stats in assignee_stats.items():
+        if assignee != 'Unassigned' and stats['total'] > 0:
+            efficiency_score = (stats['completed'] / stats['total'] * 100)
+            top_performers.append({
+                "name": assignee,
+                "completed_items": stats['completed'],
+                "efficiency_score": round(efficiency_score, 1),
+                "workload_balance": "optimal" if 5 <= stats['total'] <= 15 else ("heavy" if stats['total'] > 15 else "light")
+            })
+    
+    top_performers.sort(key=lambda x: x['efficiency_score'], reverse=True)
+    
+    # Generate AI insights
+    ai_analysis = f"Portfolio Analysis: {total_projects} projects with {total_issues} total issues. Completion rate of {completion_rate:.1f}% indicates {'strong' if completion_rate > 70 else 'moderate' if completion_rate > 50 else 'needs improvement'} performance. {active_contributors} active contributors are engaged across the portfolio."
+    
+    dashboard_metrics = {
+        "portfolio_summary": {
+            "total_projects": total_projects,
+            "total_issues": total_issues,
+            "completed_items": completed_items,
+            "completion_rate": round(completion_rate, 1),
+            "active_contributors": active_contributors
+        },
+        "project_health": project_health,
+        "team_performance": {
+            "top_performers": top_performers[:5],  # Top 5 performers
+            "workload_distribution": {
+                "balanced": len([p for p in top_performers if p['workload_balance'] == 'optimal']),
+                "overloaded": len([p for p in top_performers if p['workload_balance'] == 'heavy']),
+                "underutilized": len([p for p in top_performers if p['workload_balance'] == 'light'])
+            },
+            "capacity_utilization": round(completion_rate, 1)
+        },
+        "quality_metrics": {
+            "defect_rate": 5.2,  # Placeholder
+            "resolution_time": {
+                "average_days": 3.5,  # Placeholder
+                "trend": "improving"
+            },
+            "customer_satisfaction": 87.5,  # Placeholder
+            "technical_debt_score": 15.3  # Placeholder
+        },
+        "strategic_insights": {
+            "ai_analysis": ai_analysis,
+            "risk_assessment": [
+                {
+                    "type": "medium",
+                    "description": "Some projects showing lower completion rates",
+                    "impact": "Potential delivery delays",
+                    "recommendation": "Review resource allocation and project priorities"
+                }
+            ],
+            "recommendations": [
+                "Focus on projects with critical status",
+                "Consider redistributing workload for better balance",
+                "Implement regular progress reviews"
+            ]
+        }
+    }
+    
+    store_dashboard(project_filter, dashboard_metrics)
+    return dashboard_metrics
+
+async def _run_dashboard_job(job_id: str, project_filter: str) -> None:
+    """Compute dashboard metrics for a background job and record the outcome"""
+    job = app_state.dashboard_jobs[job_id]
+    try:
+        job["result"] = await build_dashboard_metrics(project_filter)
+        job["status"] = "done"
+    except Exception as e:
+        logger.error(f"Leadership dashboard job {job_id} failed: {e}")
+        job["error"] = str(e)
+        job["status"] = "failed"
+    job["finished"] = current_iso_timestamp()
+
+def start_dashboard_job(project_filter: str) -> str:
+    """Queue a dashboard computation, reusing a running job for the same filter"""
+    for job_id, job in app_state.dashboard_jobs.items():
+        if job["project"] == project_filter and job["status"] == "running":
+            return job_id
+    
+    jobs = app_state.dashboard_jobs
+    while len(jobs) >= DASHBOARD_JOB_MAX_ENTRIES:
+        finished = next((jid for jid, job in jobs.items() if job["status"] != "running"), None)
+        if finished is None:
+            break
+        del jobs[finished]
+    
+    job_id = uuid.uuid4().hex
+    jobs[job_id] = {"status": "running", "project": project_filter, "started": current_iso_timestamp()}
+    task = asyncio.create_task(_run_dashboard_job(job_id, project_filter))
+    app_state.background_tasks.add(task)
+    task.add_done_callback(app_state.background_tasks.discard)
+    return job_id
+
 @app.post("/api/leadership/dashboard", tags=["Leadership"], summary="Get Leadership Dashboard Metrics")
 async def get_leadership_dashboard(request: Dict[str, Any]):
     """Get comprehensive leadership dashboard metrics with AI insights"""
@@ -1977,134 +2386,28 @@ async def get_leadership_dashboard(request: Dict[str, Any]):
         # Get project filter from query params or request body
         project_filter = request.get('project', 'ALL')
         
-        # Initialize AI engine if needed
-        if not app_state.ai_engine:
-            app_state.ai_engine = IntelligentAIEngine(app_state.jira_client, app_state.confluence_client)
-        
-        # Get basic Jira data
-        jql = "project is not EMPTY ORDER BY updated DESC"
-        if project_filter != 'ALL':
-            jql = f'project = "{project_filter}" ORDER BY updated DESC'
-        
-        issues_data = await app_state.jira_client.search(jql, max_results=1000)
-        issues = issues_data.get('issues', [])
-        
-        # Calculate portfolio summary
-        total_issues = len(issues)
-        completed_items = len([i for i in issues if i.get('fields', {}).get('status', {}).get('name') in ['Done', 'Closed', 'Resolved']])
-        completion_rate = (completed_items / total_issues * 100) if total_issues > 0 else 0
-        
-        # Get unique projects
-        projects = list(set([i.get('fields', {}).get('project', {}).get('key', 'Unknown') for i in issues]))
-        total_projects = len(projects)
-        
-        # Get active contributors
-        assignees = [i.get('fields', {}).get('assignee', {}).get('displayName', 'Unassigned') for i in issues if i.get('fields', {}).get('assignee')]
-        active_contributors = len(set(assignees))
-        
-        # Calculate project health
-        project_health = {}
-        for project in projects:
-            project_issues = [i for i in issues if i.get('fields', {}).get('project', {}).get('key') == project]
-            project_completed = len([i for i in project_issues if i.get('fields', {}).get('status', {}).get('name') in ['Done', 'Closed', 'Resolved']])
-            project_total = len(project_issues)
-            health_score = (project_completed / project_total * 100) if project_total > 0 else 0
-            
-            if health_score >= 80:
-                status = 'excellent'
-            elif health_score >= 60:
-                status = 'good'
-            elif health_score >= 40:
-                status = 'needs_attention'
-            else:
-                status = 'critical'
-            
-            project_health[project] = {
-                "name": project,
-                "health_score": round(health_score, 1),
-                "status": status,
-                "total_issues": project_total,
-                "completed": project_completed,
-                "in_progress": len([i for i in project_issues if i.get('fields', {}).get('status', {}).get('name') == 'In Progress']),
-                "blocked": len([i for i in project_issues if i.get('fields', {}).get('status', {}).get('name') == 'Blocked']),
-                "velocity_trend": "stable"  # Simplified for now
-            }
-        
-        # Calculate team performance
-        assignee_stats = {}
-        for issue in issues:
-            assignee = issue.get('fields', {}).get('assignee', {}).get('displayName', 'Unassigned')
-            if assignee not in assignee_stats:
-                assignee_stats[assignee] = {'completed': 0, 'total': 0}
-            assignee_stats[assignee]['total'] += 1
-            if issue.get('fields', {}).get('status', {}).get('name') in ['Done', 'Closed', 'Resolved']:
-                assignee_stats[assignee]['completed'] += 1
-        
-        top_performers = []
-        for assignee, stats in assignee_stats.items():
-            if assignee != 'Unassigned' and stats['total'] > 0:
-                efficiency_score = (stats['completed'] / stats['total'] * 100)
-                top_performers.append({
-                    "name": assignee,
-                    "completed_items": stats['completed'],
-                    "efficiency_score": round(efficiency_score, 1),
-                    "workload_balance": "optimal" if 5 <= stats['total'] <= 15 else ("heavy" if stats['total'] > 15 else "light")
-                })
+        cached_metrics = get_cached_dashboard(project_filter)
+        if cached_metrics is not None:
+            return DefaultResponse({
+                "success": True,
+                "dashboard": cached_metrics,
+                "cached": True
+            })
         
-        top_performers.sort(key=lambda x: x['efficiency_score'], reverse=True)
+        if request.get('background'):
+            job_id = start_dashboard_job(project_filter)
+            return DefaultResponse({
+                "success": True,
+                "job_id": job_id,
+                "status": "running"
+            }, status_code=202)
         
-        # Generate AI insights
-        ai_analysis = f"Portfolio Analysis: {total_projects} projects with {total_issues} total issues. Completion rate of {completion_rate:.1f}% indicates {'strong' if completion_rate > 70 else 'moderate' if completion_rate > 50 else 'needs improvement'} performance. {active_contributors} active contributors are engaged across the portfolio."
+        dashboard_metrics = await build_dashboard_metrics(project_filter)
         
-        dashboard_metrics = {
-            "portfolio_summary": {
-                "total_projects": total_projects,
-                "total_issues": total_issues,
-                "completed_items": completed_items,
-                "completion_rate": round(completion_rate, 1),
-                "active_contributors": active_contributors
-            },
-            "project_health": project_health,
-            "team_performance": {
-                "top_performers": top_performers[:5],  # Top 5 performers
-                "workload_distribution": {
-                    "balanced": len([p for p in top_performers if p['workload_balance'] == 'optimal']),
-                    "overloaded": len([p for p in top_performers if p['workload_balance'] == 'heavy']),
-                    "underutilized": len([p for p in top_performers if p['workload_balance'] == 'light'])
-                },
-                "capacity_utilization": round(completion_rate, 1)
-            },
-            "quality_metrics": {
-                "defect_rate": 5.2,  # Placeholder
-                "resolution_time": {
-                    "average_days": 3.5,  # Placeholder
-                    "trend": "improving"
-                },
-                "customer_satisfaction": 87.5,  # Placeholder
-                "technical_debt_score": 15.3  # Placeholder
-            },
-            "strategic_insights": {
-                "ai_analysis": ai_analysis,
-                "risk_assessment": [
-                    {
-                        "type": "medium",
-                        "description": "Some projects showing lower completion rates",
-                        "impact": "Potential delivery delays",
-                        "recommendation": "Review resource allocation and project priorities"
-                    }
-                ],
-                "recommendations": [
-                    "Focus on projects with critical status",
-                    "Consider redistributing workload for better balance",
-                    "Implement regular progress reviews"
-                ]
-            }
-        }
-        
-        return {
+        return DefaultResponse({
             "success": True,
             "dashboard": dashboard_metrics
-        }
+        })
         
     except Exception as e:
         logger.error(f"Leadership dashboard error: {e}")
@@ -2113,6 +2416,40 @@ async def get_leadership_dashboard(request: Dict[str, Any]):
             "error": f"Failed to generate dashboard metrics: {str(e)}"
         }
 
+@app.get("/api/leadership/dashboard/status/{job_id}", tags=["Leadership"], summary="Get Leadership Dashboard Job Status")
+async def get_leadership_dashboard_job(job_id: str):
+    """Poll a background dashboard job; 202 while running, 200 once finished"""
+    job = app_state.dashboard_jobs.get(job_id)
+    if job is None:
+        return DefaultResponse(create_error_response("Job not found", f"No dashboard job {job_id}", 404), status_code=404)
+    
+    if job["status"] == "running":
+        return DefaultResponse({"success": True, "job_id": job_id, "status": "running", "started": job["started"]}, status_code=202)
+    
+    if job["status"] == "failed":
+        return DefaultResponse({
+            "success": False,
+            "job_id": job_id,
+            "status": "failed",
+            "error": f"Failed to generate dashboard metrics: {job['error']}"
+        })
+    
+    return DefaultResponse({
+        "success": True,
+        "job_id": job_id,
+        "status": "done",
+        "finished": job["finished"],
+        "dashboard": job["result"]
+    })
+
+@app.post("/api/leadership/dashboard/invalidate", tags=["Leadership"], summary="Invalidate Leadership Dashboard Cache")
+async def invalidate_leadership_dashboard():
+    """Drop cached leadership dashboard metrics and the Jira search results they are built from"""
+    app_state.dashboard_cache.clear()
+    if app_state.jira_client:
+        app_state.jira_client.clear_cache()
+    return create_success_response(message="Dashboard cache cleared")
+
 @app.get("/api/chat/team-performance", tags=["Analytics"], summary="Get Team Performance Analysis")
 async def get_team_performance():
     """Get team performance comparison and metrics"""
@@ -2120,12 +2457,10 @@ async def get_team_performance():
         if not app_state.jira_configured or not app_state.jira_client:
             return create_error_response("Jira not configured", "Please configure Jira first", 400)
         
-        # Initialize advanced chatbot if needed
-        if not app_state.advanced_chatbot:
-            app_state.advanced_chatbot = AdvancedChatbotEngine(app_state.jira_client)
+        _, _, advanced_chatbot = await _ensure_chat_stack()
         
         # Process team performance query
-        result = await app_state.advanced_chatbot.process_advanced_query("Compare team performance this sprint")
+        result = await advanced_chatbot.process_advanced_query(TEAM_PERFORMANCE_QUERY)
         
         return create_success_response({
             "team_analysis": result.get('response', ''),
@@ -2145,12 +2480,15 @@ async def semantic_search_endpoint(request: ChatRequest):
         if not app_state.jira_configured or not app_state.jira_client:
             return create_error_response("Jira not configured", "Please configure Jira first", 400)
         
-        # Initialize advanced chatbot if needed
-        if not app_state.advanced_chatbot:
-            app_state.advanced_chatbot = AdvancedChatbotEngine(app_state.jira_client)
+        _, _, advanced_chatbot = await _ensure_chat_stack()
         
-        # Process semantic search query
-        result = await app_state.advanced_chatbot.process_advanced_query(message)
+        # Reuse the answer to the same recent query (compared after case/whitespace normalization)
+        result = advanced_chatbot.semantic_cache.get(message)
+        if result is None:
+            result = await advanced_chatbot.process_advanced_query(message)
+            # Don't pin a transient Jira/timeout failure for the whole TTL
+            if not result.get('error'):
+                advanced_chatbot.semantic_cache.put(message, result)
         
         return create_success_response({
             "search_results": result.get('response', ''),
@@ -2186,19 +2524,25 @@ async def test_jira_connection(config: JiraConfigRequest):
         # Initialize the async client
         await jira_client.initialize()
         
-        # Test the connection
-        try:
-            # Try to get current sprint
-            current_sprint = await jira_client.get_current_sprint()
-            sprint_info = f"Current sprint: {current_sprint.get('name', 'Unknown')}" if current_sprint else "No active sprint"
-            
-            # Try a simple search
-            search_result = await jira_client.search("project is not EMPTY", max_results=1)
-            total_issues = search_result.get('total', 0)
-        except Exception as e:
-            logger.warning(f"Could not get current sprint, but connection may still work: {e}")
+        # Test the connection: sprint lookup and a simple search share the pooled connection concurrently
+        current_sprint, search_result = await asyncio.gather(
+            jira_client.get_current_sprint(),
+            jira_client.search("project is not EMPTY", max_results=1, fields=['key']),
+            return_exceptions=True
+        )
+        
+        if isinstance(current_sprint, Exception):
+            logger.warning(f"Could not get current sprint, but connection may still work: {current_sprint}")
+            current_sprint = None
             sprint_info = "Connection established but sprint info unavailable"
-            total_issues = 0
+        else:
+            sprint_info = f"Current sprint: {current_sprint.get('name', 'Unknown')}" if current_sprint else "No active sprint"
+        
+        total_issues = 0 if isinstance(search_result, Exception) else search_result.get('total', 0)
+        
+        # Retry the warm-up once a connection is known to work
+        if app_state.advanced_chatbot is None:
+            schedule_warmup()
         
         return {
             "success": True,
@@ -2228,66 +2572,207 @@ async def test_jira_connection(config: JiraConfigRequest):
         if 'jira_client' in locals():
             await jira_client.close()
 
-@app.post("/api/export/pdf", tags=["Export"], summary="Export Chat to PDF")
-async def export_pdf():
-    """Export chat to PDF using reportlab"""
-    try:
-        if not REPORTLAB_AVAILABLE:
-            raise HTTPException(status_code=500, detail="ReportLab not available. Please install reportlab package.")
-        
-        from reportlab.lib.pagesizes import letter
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        import io
-        
-        # Create PDF in memory
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            spaceAfter=30,
+def build_chat_pdf(messages, out_file) -> None:
+    """Render chat messages as a PDF into a writable binary file object"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from xml.sax.saxutils import escape
+    
+    doc = SimpleDocTemplate(out_file, pagesize=letter)
+    styles = getSampleStyleSheet()
+    
+    # Custom styles
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        spaceAfter=30,
+    )
+    
+    # One paragraph per message; spaceAfter separates messages instead of Spacers
+    message_style = ParagraphStyle(
+        'CustomMessage',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=20,
+    )
+    
+    # Build PDF content
+    story = []
+    story.append(Paragraph("Leadership Quality Tool - Chat Export", title_style))
+    story.append(Spacer(1, 20))
+    
+    # Add chat messages, escaping text so stray '<' or '&' can't break the paragraph markup
+    story.extend(
+        Paragraph(
+            f"<b>Message {i}:</b> {escape(str(message.get('message', '')))}<br/>"
+            f"<b>Response:</b> {escape(str(message.get('response', '')))}<br/>"
+            f"<b>Timestamp:</b> {escape(str(message.get('timestamp', '')))}",
+            message_style,
         )
+        for i, message in enumerate(messages, 1)
+    )
+    
+    # Build PDF
+    doc.build(story)
+
+def build_chat_pptx(messages, out_file) -> int:
+    """Render chat messages as a PowerPoint deck into a binary file object, returning the slide count"""
+    from pptx import Presentation
+    from pptx.util import Pt
+    
+    # Create presentation
+    prs = Presentation()
+    
+    # Add title slide
+    title_slide_layout = prs.slide_layouts[0]
+    slide = prs.slides.add_slide(title_slide_layout)
+    title = slide.shapes.title
+    subtitle = slide.placeholders[1]
+    
+    title.text = "Leadership Quality Tool"
+    subtitle.text = f"Chat Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    
+    # Add content slides
+    content_layout = prs.slide_layouts[1]
+    
+    for i, message in enumerate(messages, 1):
+        slide = prs.slides.add_slide(content_layout)
+        title = slide.shapes.title
+        content = slide.placeholders[1]
         
-        content_style = ParagraphStyle(
-            'CustomContent',
-            parent=styles['Normal'],
-            fontSize=10,
-            spaceAfter=12,
-        )
+        title.text = f"Message {i}"
         
-        # Build PDF content
-        story = []
-        story.append(Paragraph("Leadership Quality Tool - Chat Export", title_style))
-        story.append(Spacer(1, 20))
+        # Format content
+        text_frame = content.text_frame
+        text_frame.clear()
         
-        # Add chat messages
-        for i, message in enumerate(app_state.messages, 1):
-            story.append(Paragraph(f"<b>Message {i}:</b> {message.get('message', '')}", content_style))
-            story.append(Paragraph(f"<b>Response:</b> {message.get('response', '')}", content_style))
-            story.append(Paragraph(f"<b>Timestamp:</b> {message.get('timestamp', '')}", content_style))
-            story.append(Spacer(1, 20))
+        # Add message
+        p = text_frame.paragraphs[0]
+        p.text = f"User: {message.get('message', '')}"
+        p.font.size = Pt(12)
         
-        # Build PDF
-        doc.build(story)
+        # Add response
+        p = text_frame.add_paragraph()
+        p.text = f"Assistant: {message.get('response', '')}"
+        p.font.size = Pt(10)
         
-        # Get PDF content
-        pdf_content = buffer.getvalue()
-        buffer.close()
+        # Add timestamp
+        p = text_frame.add_paragraph()
+        p.text = f"Time: {message.get('timestamp', '')}"
+        p.font.size = Pt(8)
+        p.font.italic = True
+    
+    prs.save(out_file)
+    return len(prs.slides)
+
+async def _iter_file(file_obj, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Yield a file's contents in chunks, closing it when done"""
+    try:
+        while chunk := file_obj.read(chunk_size):
+            yield chunk
+    finally:
+        file_obj.close()
+
+def export_filename(extension: str) -> str:
+    """Unique export filename; the random suffix keeps exports started in the same second apart"""
+    return f"chat_export_{export_timestamp()}_{uuid.uuid4().hex[:8]}.{extension}"
+
+def _write_export(builder, messages: List[Dict[str, Any]], path: str):
+    """Run an export builder into a temporary file and move it into place, returning the builder's result"""
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as out_file:
+            result = builder(messages, out_file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return result
+
+def register_export_file(filename: str, path: str) -> None:
+    """Record a rendered export for download, deleting the oldest files beyond the retention limit"""
+    files = app_state.export_files
+    files.pop(filename, None)
+    files[filename] = path
+    while len(files) > EXPORT_FILE_MAX_ENTRIES:
+        _, old_path = files.popitem(last=False)
+        try:
+            os.remove(old_path)
+        except OSError:
+            pass
+
+async def render_pdf_export(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a PDF export on disk and register it for download"""
+    filename = export_filename("pdf")
+    path = os.path.join(EXPORT_DIR, filename)
+    await asyncio.to_thread(_write_export, build_chat_pdf, messages, path)
+    register_export_file(filename, path)
+    
+    return {
+        "filename": filename,
+        "size_bytes": os.path.getsize(path)
+    }
+
+async def render_pptx_export(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a PowerPoint export on disk and register it for download"""
+    # python-pptx is synchronous, so build off the event loop
+    filename = export_filename("pptx")
+    path = os.path.join(EXPORT_DIR, filename)
+    slide_count = await asyncio.to_thread(_write_export, build_chat_pptx, messages, path)
+    register_export_file(filename, path)
+    
+    return {
+        "filename": filename,
+        "size_bytes": os.path.getsize(path),
+        "slides": slide_count
+    }
+
+async def _run_export_job(job_id: str, renderer, messages: List[Dict[str, Any]]) -> None:
+    """Render an export for a background job and record the outcome"""
+    job = app_state.export_jobs[job_id]
+    try:
+        job["result"] = await renderer(messages)
+        job["status"] = "done"
+    except Exception as e:
+        logger.error(f"Export job {job_id} failed: {e}")
+        job["error"] = str(e)
+        job["status"] = "failed"
+    job["finished"] = current_iso_timestamp()
+
+def start_export_job(export_type: str, renderer) -> str:
+    """Queue an export against a snapshot of the current chat history"""
+    jobs = app_state.export_jobs
+    while len(jobs) >= EXPORT_JOB_MAX_ENTRIES:
+        finished = next((jid for jid, job in jobs.items() if job["status"] != "running"), None)
+        if finished is None:
+            break
+        del jobs[finished]
+    
+    job_id = uuid.uuid4().hex
+    jobs[job_id] = {"status": "running", "type": export_type, "started": current_iso_timestamp()}
+    task = asyncio.create_task(_run_export_job(job_id, renderer, list(app_state.messages)))
+    app_state.background_tasks.add(task)
+    task.add_done_callback(app_state.background_tasks.discard)
+    return job_id
+
+@app.post("/api/export/pdf", tags=["Export"], summary="Export Chat to PDF")
+async def export_pdf(background: bool = False):
+    """Export chat to PDF using reportlab; with background=true, return a job id to poll"""
+    try:
+        if not REPORTLAB_AVAILABLE:
+            raise HTTPException(status_code=500, detail="ReportLab not available. Please install reportlab package.")
         
-        # Store in app state for download
-        filename = f"chat_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        app_state.export_files[filename] = pdf_content
+        if background:
+            job_id = start_export_job("pdf", render_pdf_export)
+            return DefaultResponse({"success": True, "job_id": job_id, "status": "running"}, status_code=202)
         
-        return create_success_response({
-            "filename": filename,
-            "size_bytes": len(pdf_content)
-        }, "PDF exported successfully")
+        return create_success_response(await render_pdf_export(list(app_state.messages)), "PDF exported successfully")
         
     except ImportError:
         return create_error_response("PDF export failed", "reportlab package not installed")
@@ -2295,75 +2780,41 @@ async def export_pdf():
         logger.error(f"PDF export error: {e}")
         return create_error_response("PDF export failed", str(e))
 
+@app.get("/api/export/pdf/stream", tags=["Export"], summary="Stream Chat PDF")
+async def stream_pdf_export():
+    """Build the chat PDF into a spooled temp file and stream it straight back"""
+    if not REPORTLAB_AVAILABLE:
+        raise HTTPException(status_code=500, detail="ReportLab not available. Please install reportlab package.")
+    
+    # Small exports stay in memory; larger ones spill to disk instead of growing the heap
+    spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES)
+    try:
+        await asyncio.to_thread(build_chat_pdf, list(app_state.messages), spool)
+    except Exception as e:
+        spool.close()
+        logger.error(f"PDF export error: {e}")
+        raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
+    spool.seek(0)
+    
+    filename = f"chat_export_{export_timestamp()}.pdf"
+    return StreamingResponse(
+        _iter_file(spool),
+        media_type='application/pdf',
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
 @app.post("/api/export/powerpoint", tags=["Export"], summary="Export Chat to PowerPoint")
-async def export_powerpoint():
-    """Export chat to PowerPoint using python-pptx"""
+async def export_powerpoint(background: bool = False):
+    """Export chat to PowerPoint using python-pptx; with background=true, return a job id to poll"""
     try:
         if not PPTX_AVAILABLE:
             raise HTTPException(status_code=500, detail="python-pptx not available. Please install python-pptx package.")
         
-        from pptx import Presentation
-        from pptx.util import Inches, Pt
-        from pptx.enum.text import PP_ALIGN
-        import io
-        
-        # Create presentation
-        prs = Presentation()
-        
-        # Add title slide
-        title_slide_layout = prs.slide_layouts[0]
-        slide = prs.slides.add_slide(title_slide_layout)
-        title = slide.shapes.title
-        subtitle = slide.placeholders[1]
+        if background:
+            job_id = start_export_job("powerpoint", render_pptx_export)
+            return DefaultResponse({"success": True, "job_id": job_id, "status": "running"}, status_code=202)
         
-        title.text = "Leadership Quality Tool"
-        subtitle.text = f"Chat Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        
-        # Add content slides
-        content_layout = prs.slide_layouts[1]
-        
-        for i, message in enumerate(app_state.messages, 1):
-            slide = prs.slides.add_slide(content_layout)
-            title = slide.shapes.title
-            content = slide.placeholders[1]
-            
-            title.text = f"Message {i}"
-            
-            # Format content
-            text_frame = content.text_frame
-            text_frame.clear()
-            
-            # Add message
-            p = text_frame.paragraphs[0]
-            p.text = f"User: {message.get('message', '')}"
-            p.font.size = Pt(12)
-            
-            # Add response
-            p = text_frame.add_paragraph()
-            p.text = f"Assistant: {message.get('response', '')}"
-            p.font.size = Pt(10)
-            
-            # Add timestamp
-            p = text_frame.add_paragraph()
-            p.text = f"Time: {message.get('timestamp', '')}"
-            p.font.size = Pt(8)
-            p.font.italic = True
-        
-        # Save to memory
-        buffer = io.BytesIO()
-        prs.save(buffer)
-        pptx_content = buffer.getvalue()
-        buffer.close()
-        
-        # Store in app state for download
-        filename = f"chat_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pptx"
-        app_state.export_files[filename] = pptx_content
-        
-        return create_success_response({
-            "filename": filename,
-            "size_bytes": len(pptx_content),
-            "slides": len(prs.slides)
-        }, "PowerPoint exported successfully")
+        return create_success_response(await render_pptx_export(list(app_state.messages)), "PowerPoint exported successfully")
         
     except ImportError:
         return create_error_response("PowerPoint export failed", "python-pptx package not installed")
@@ -2371,14 +2822,28 @@ async def export_powerpoint():
         logger.error(f"PowerPoint export error: {e}")
         return create_error_response("PowerPoint export failed", str(e))
 
+@app.get("/api/export/jobs/{job_id}", tags=["Export"], summary="Get Export Job Status")
+async def get_export_job(job_id: str):
+    """Poll a background export job; 202 while running, 200 with the download filename once done"""
+    job = app_state.export_jobs.get(job_id)
+    if job is None:
+        return DefaultResponse(create_error_response("Job not found", f"No export job {job_id}", 404), status_code=404)
+    
+    if job["status"] == "running":
+        return DefaultResponse({"success": True, "job_id": job_id, "status": "running", "started": job["started"]}, status_code=202)
+    
+    if job["status"] == "failed":
+        return {"success": False, "job_id": job_id, "status": "failed", "error": f"Export failed: {job['error']}"}
+    
+    return {"success": True, "job_id": job_id, "status": "done", "finished": job["finished"], "data": job["result"]}
+
 @app.get("/api/export/download/{filename}", tags=["Export"], summary="Download Exported File")
 async def download_export(filename: str):
     """Download exported file"""
-    if filename not in app_state.export_files:
+    path = app_state.export_files.get(filename)
+    if not path or not os.path.exists(path):
         raise HTTPException(status_code=404, detail="File not found")
     
-    content = app_state.export_files[filename]
-    
     # Determine content type
     if filename.endswith('.pdf'):
         media_type = 'application/pdf'
@@ -2387,11 +2852,64 @@ async def download_export(filename: str):
     else:
         media_type = 'application/octet-stream'
     
-    return StreamingResponse(
-        io.BytesIO(content),
-        media_type=media_type,
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    # FileResponse streams from disk (sendfile where available) without loading the file into memory
+    return FileResponse(path, media_type=media_type, filename=filename)
+
+async def fetch_all_issues(jql: str, fields, page_size: int = METRICS_PAGE_SIZE, max_pages: int = METRICS_MAX_PAGES) -> List[Dict[str, Any]]:
+    """Fetch every issue matching a JQL query, by cursor when offered, otherwise requesting offsets concurrently"""
+    jira_client = app_state.jira_client
+    semaphore = asyncio.Semaphore(METRICS_PAGE_CONCURRENCY)
+    
+    async def fetch_page(start_at: int = 0, next_page_token: Optional[str] = None) -> Dict[str, Any]:
+        async with semaphore:
+            return await jira_client.search(jql, max_results=page_size, fields=fields, start_at=start_at, next_page_token=next_page_token) or {}
+    
+    all_issues = []
+    seen_keys = set()  # Track unique issue keys to detect duplicates
+    
+    def add_page(issues_data: Dict[str, Any]) -> bool:
+        """Merge one page; False once the page is short, empty or only repeats known issues"""
+        issues_batch = issues_data.get('issues', [])
+        new_issues = [issue for issue in issues_batch if issue.get('key') not in seen_keys]
+        if issues_batch and not new_issues:
+            logger.warning("Page only contained already-seen issues, stopping pagination")
+            return False
+        seen_keys.update(issue.get('key') for issue in new_issues)
+        all_issues.extend(new_issues)
+        return len(issues_batch) == page_size and not issues_data.get('isLast', False)
+    
+    first_page = await fetch_page(0)
+    has_more = add_page(first_page)
+    
+    limit = page_size * max_pages
+    total = first_page.get('total')
+    next_page_token = first_page.get('nextPageToken')
+    if next_page_token and not first_page.get('isLast', False):
+        # API v3 search/jql hands back a cursor; following it avoids re-walking skipped offsets
+        for _ in range(max_pages - 1):
+            page = await fetch_page(next_page_token=next_page_token)
+            fetched_before = len(all_issues)
+            add_page(page)
+            next_page_token = page.get('nextPageToken')
+            if len(all_issues) == fetched_before or not next_page_token or page.get('isLast', False):
+                break
+    elif has_more and total:
+        # Total is known, so request every remaining page at once
+        offsets = range(page_size, min(total, limit), page_size)
+        for page in await asyncio.gather(*(fetch_page(offset) for offset in offsets)):
+            add_page(page)
+    elif has_more:
+        # Neither total nor cursor: request pages in concurrent waves until one comes back short
+        next_offset = page_size
+        while next_offset < limit:
+            offsets = range(next_offset, min(next_offset + page_size * METRICS_PAGE_CONCURRENCY, limit), page_size)
+            pages = await asyncio.gather(*(fetch_page(offset) for offset in offsets))
+            if not all([add_page(page) for page in pages]):
+                break
+            next_offset = offsets[-1] + page_size
+    
+    logger.info(f"Fetched {len(all_issues)} issues for metrics")
+    return all_issues
 
 @app.post("/api/jira/metrics", tags=["JIRA"], summary="Get Jira Metrics")
 async def get_jira_metrics(request: Dict[str, Any]):
@@ -2405,88 +2923,26 @@ async def get_jira_metrics(request: Dict[str, Any]):
         # Build JQL query - handle None case properly
         if project_key and project_key != 'null':
             jql = f'project = "{project_key}"'
+            cache_key = project_key
         else:
-            jql = "project is not EMPTY"
+            jql = _JQL_ALL
+            cache_key = "__all__"
         
-        # Get ALL issues to show exact real values
-        fields = ['key', 'summary', 'status', 'assignee', 'priority', 'issuetype', 'project', 'created', 'updated', 'description', 'reporter', 'labels', 'components', 'fixVersions', 'duedate', 'customfield_10016']
+        cached = app_state.metrics_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < METRICS_CACHE_TTL:
+            app_state.metrics_cache_stats["hits"] += 1
+            return DefaultResponse({
+                "success": True,
+                "metrics": cached[1]
+            })
+        app_state.metrics_cache_stats["misses"] += 1
         
         # Get ALL issues with proper pagination to show exact values
-        all_issues = []
-        start_at = 0
-        max_results = 100  # Jira API v3 max limit is 100 per request
-        batch_count = 0
-        seen_keys = set()  # Track unique issue keys to detect duplicates
-        
-        # Get total count first - Jira API v3 doesn't return total in response
-        try:
-            count_data = await app_state.jira_client.search(jql, max_results=1, fields=['key'])
-            # Jira API v3 doesn't provide total count in response
-            total_count_from_api = 0  # We'll count as we go
-            logger.info(f"Jira API response structure: {list(count_data.keys()) if count_data else 'None'}")
-        except Exception as e:
-            logger.warning(f"Could not get count data: {e}")
-            total_count_from_api = 0
-        
         try:
-            while True:
-                batch_count += 1
-                logger.info(f"Fetching batch #{batch_count} starting at {start_at}")
-                issues_data = await app_state.jira_client.search(jql, max_results=max_results, fields=fields, start_at=start_at)
-                
-                if not issues_data:
-                    logger.error("Jira API returned None")
-                    break
-                    
-                issues_batch = issues_data.get('issues', [])
-                logger.info(f"Got {len(issues_batch)} issues in batch #{batch_count} (Total so far: {len(all_issues) + len(issues_batch)})")
-                
-                if not issues_batch:
-                    logger.info("No more issues found, stopping pagination")
-                    break
-                
-                # Check for duplicates
-                batch_keys = [issue.get('key') for issue in issues_batch if issue.get('key')]
-                duplicates = [key for key in batch_keys if key in seen_keys]
-                
-                if duplicates:
-                    logger.warning(f"DUPLICATES DETECTED: {duplicates[:5]}... (showing first 5)")
-                    logger.warning("Stopping pagination to prevent infinite loop")
-                    break
-                
-                # Add new unique issues
-                seen_keys.update(batch_keys)
-                all_issues.extend(issues_batch)
-                
-                # Check if this is the last page (Jira API v3 uses isLast)
-                is_last = issues_data.get('isLast', False)
-                next_page_token = issues_data.get('nextPageToken')
-                logger.info(f"isLast flag: {is_last}, nextPageToken: {next_page_token}")
-                
-                # Stop if we got fewer issues than requested (this is the reliable way to detect end)
-                if len(issues_batch) < max_results:
-                    logger.info(f"Got fewer issues ({len(issues_batch)}) than requested ({max_results}), stopping")
-                    break
-                    
-                # Stop if isLast is true (this means we've reached the end)
-                if is_last:
-                    logger.info("isLast=true, stopping pagination")
-                    break
-                    
-                start_at += max_results
-                
-                # Add small delay to prevent rate limiting
-                import asyncio
-                await asyncio.sleep(0.2)  # 200ms delay between batches
-                
-                # Safety limit to prevent infinite loops (adjust as needed)
-                if batch_count > 50:  # Max 50 batches = 5,000 issues (should be enough for most workspaces)
-                    logger.warning(f"Reached safety limit of {batch_count} batches, stopping")
-                    break
-                
+            all_issues = await fetch_all_issues(jql, _METRICS_FIELDS)
         except Exception as e:
             logger.error(f"Error during pagination: {e}")
-            # Continue with whatever we got
+            all_issues = []
             
         issues = all_issues
         logger.info(f"Retrieved {len(issues)} total issues (exact count)")
@@ -2498,118 +2954,62 @@ async def get_jira_metrics(request: Dict[str, Any]):
         # Use exact real values from all issues
         display_total = total_issues  # Exact count of all issues
         
-        # Calculate resolved issues from ALL actual data with error handling
-        resolved_issues = 0
-        try:
-            for i in issues:
-                if i and i.get('fields'):
-                    status = i.get('fields', {}).get('status', {})
-                    if status:
-                        status_category = status.get('statusCategory', {})
-                        if status_category and status_category.get('name') == 'Done':
-                            resolved_issues += 1
-            
-            if resolved_issues == 0:
-                # Fallback: count issues with "Done" status names
-                resolved_statuses = ['Done', 'Resolved', 'Closed', 'Completed']
-                for i in issues:
-                    if i and i.get('fields'):
-                        status_name = i.get('fields', {}).get('status', {}).get('name')
-                        if status_name in resolved_statuses:
-                            resolved_issues += 1
-        except Exception as e:
-            logger.error(f"Error calculating resolved issues: {e}")
-            resolved_issues = max(1, int(total_issues * 0.25))  # Fallback estimate
-        
-        logger.info(f"Exact resolved issues: {resolved_issues} out of {total_issues}")
-        
-        open_issues = total_issues - resolved_issues
-        
-        # Count by issue type with error handling
-        bugs = stories = tasks = epics = subtasks = 0
+        # Aggregate every metric in a single pass over the issues
+        type_counts = Counter()
+        issues_by_status = Counter()
+        issues_by_priority = Counter()
+        issues_by_assignee = Counter()
+        resolved_by_category = resolved_by_name = 0
+        story_points = 0
         try:
             for i in issues:
-                if i and i.get('fields'):
-                    issue_type = i.get('fields', {}).get('issuetype', {})
-                    if issue_type:
-                        type_name = issue_type.get('name')
-                        if type_name == 'Bug':
-                            bugs += 1
-                        elif type_name == 'Story':
-                            stories += 1
-                        elif type_name == 'Task':
-                            tasks += 1
-                        elif type_name == 'Epic':
-                            epics += 1
-                        elif type_name == 'Sub-task':
-                            subtasks += 1
+                fields = i.get('fields') if i else None
+                if not fields:
+                    continue
+                
+                status = fields.get('status')
+                if status:
+                    if (status.get('statusCategory') or _EMPTY_DICT).get('name') == DONE_CATEGORY:
+                        resolved_by_category += 1
+                    status_name = status.get('name', 'Unknown')
+                    if status_name in RESOLVED_STATUSES:
+                        resolved_by_name += 1
+                    issues_by_status[status_name] += 1
+                
+                type_counts[(fields.get('issuetype') or _EMPTY_DICT).get('name')] += 1
+                
+                points = fields.get('customfield_10016')
+                if points is not None:
+                    try:
+                        story_points += int(points) or 0
+                    except (ValueError, TypeError):
+                        pass
+                
+                issues_by_priority[(fields.get('priority') or _EMPTY_DICT).get('name', 'Unknown')] += 1
+                issues_by_assignee[(fields.get('assignee') or _EMPTY_DICT).get('displayName', 'Unassigned')] += 1
+            
+            # Fallback: count issues with "Done" status names when no status category says Done
+            resolved_issues = resolved_by_category or resolved_by_name
+            bugs = type_counts['Bug']
+            stories = type_counts['Story']
+            tasks = type_counts['Task']
+            epics = type_counts['Epic']
+            subtasks = type_counts['Sub-task']
         except Exception as e:
-            logger.error(f"Error counting issue types: {e}")
-            # Use fallback counts
+            logger.error(f"Error aggregating Jira metrics: {e}")
+            # Use fallback estimates
+            resolved_issues = max(1, int(total_issues * 0.25))
             bugs = max(1, total_issues // 10)
             stories = max(1, total_issues // 5)
             tasks = max(1, total_issues // 8)
-        
-        # Calculate exact story points from ALL data with error handling
-        story_points = 0
-        try:
-            for i in issues:
-                if i and i.get('fields'):
-                    points = i.get('fields', {}).get('customfield_10016')
-                    if points is not None:
-                        try:
-                            story_points += int(points) or 0
-                        except (ValueError, TypeError):
-                            pass
-        except Exception as e:
-            logger.error(f"Error calculating story points: {e}")
-            story_points = stories * 5  # Fallback estimate
-        
-        logger.info(f"Exact story points: {story_points}")
-        
-        # Count by status with error handling
-        issues_by_status = {}
-        try:
-            for issue in issues:
-                if issue and issue.get('fields'):
-                    status_obj = issue.get('fields', {}).get('status', {})
-                    if status_obj:
-                        status_name = status_obj.get('name', 'Unknown')
-                        issues_by_status[status_name] = issues_by_status.get(status_name, 0) + 1
-        except Exception as e:
-            logger.error(f"Error counting by status: {e}")
+            epics = subtasks = 0
+            story_points = stories * 5
             issues_by_status = {'Unknown': total_issues}
-        
-        # Count by priority with error handling
-        issues_by_priority = {}
-        try:
-            for issue in issues:
-                if issue and issue.get('fields'):
-                    priority_obj = issue.get('fields', {}).get('priority', {})
-                    if priority_obj:
-                        priority_name = priority_obj.get('name', 'Unknown')
-                    else:
-                        priority_name = 'Unknown'
-                    issues_by_priority[priority_name] = issues_by_priority.get(priority_name, 0) + 1
-        except Exception as e:
-            logger.error(f"Error counting by priority: {e}")
             issues_by_priority = {'Unknown': total_issues}
-        
-        # Count by assignee with error handling
-        issues_by_assignee = {}
-        try:
-            for issue in issues:
-                if issue and issue.get('fields'):
-                    assignee_obj = issue.get('fields', {}).get('assignee', {})
-                    if assignee_obj:
-                        assignee_name = assignee_obj.get('displayName', 'Unassigned')
-                    else:
-                        assignee_name = 'Unassigned'
-                    issues_by_assignee[assignee_name] = issues_by_assignee.get(assignee_name, 0) + 1
-        except Exception as e:
-            logger.error(f"Error counting by assignee: {e}")
             issues_by_assignee = {'Unassigned': total_issues}
         
+        logger.info(f"Exact resolved issues: {resolved_issues} out of {total_issues}, story points: {story_points}")
+        
         # Calculate average resolution time (simplified)
         # For now, use a calculated estimate based on resolved issues
         avg_resolution_time = 7.5 if resolved_issues > 0 else 0  # days
@@ -2629,20 +3029,73 @@ async def get_jira_metrics(request: Dict[str, Any]):
             "storyPoints": story_points,
             "sprintVelocity": sprint_velocity,
             "avgResolutionTime": avg_resolution_time,
-            "issuesByStatus": issues_by_status,
-            "issuesByPriority": issues_by_priority,
-            "issuesByAssignee": issues_by_assignee
+            "issuesByStatus": dict(issues_by_status),
+            "issuesByPriority": dict(issues_by_priority),
+            "issuesByAssignee": dict(issues_by_assignee)
         }
+        app_state.metrics_cache[cache_key] = (time.monotonic(), metrics)
         
-        return {
+        # Return the response directly so the nested count dicts skip jsonable_encoder
+        return DefaultResponse({
             "success": True,
             "metrics": metrics
-        }
+        })
         
     except Exception as e:
         logger.error(f"Failed to get Jira metrics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/jira/cache/clear", tags=["JIRA"], summary="Clear Jira Metrics Cache")
+async def clear_jira_cache():
+    """Drop cached Jira metrics and recent search results"""
+    app_state.metrics_cache.clear()
+    if app_state.jira_client:
+        app_state.jira_client.clear_cache()
+    return create_success_response(message="Jira cache cleared")
+
+@app.get("/api/jira/cache/stats", tags=["JIRA"], summary="Get Jira Metrics Cache Stats")
+async def get_jira_cache_stats():
+    """Report Jira metrics cache size and hit/miss counts"""
+    stats = app_state.metrics_cache_stats
+    lookups = stats["hits"] + stats["misses"]
+    return create_success_response({
+        "entries": len(app_state.metrics_cache),
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+        "hit_rate": round(stats["hits"] / lookups * 100, 1) if lookups else 0.0,
+        "ttl_seconds": METRICS_CACHE_TTL
+    })
+
+async def enrich_confluence_pages(pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fill in created/author/space from page details, fetched concurrently, for search hits that lack them"""
+    missing = [p for p in pages if not p.get('created') or not p.get('author')]
+    if not missing:
+        return pages
+    
+    confluence_client = app_state.confluence_client
+    semaphore = asyncio.Semaphore(CONFLUENCE_DETAIL_CONCURRENCY)
+    
+    async def fetch_detail(page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        content_id = page.get('id') or (page.get('content') or _EMPTY_DICT).get('id')
+        if not content_id:
+            return None
+        async with semaphore:
+            return await confluence_client.get_page(content_id, expand="history,space")
+    
+    details = await asyncio.gather(*(fetch_detail(p) for p in missing))
+    for page, detail in zip(missing, details):
+        if not detail:
+            continue
+        history = detail.get('history') or _EMPTY_DICT
+        page.setdefault('id', detail.get('id', ''))
+        if not page.get('created'):
+            page['created'] = history.get('createdDate', '')
+        if not page.get('author'):
+            page['author'] = history.get('createdBy') or {}
+        if not page.get('space'):
+            page['space'] = detail.get('space') or {}
+    return pages
+
 @app.get("/api/confluence/metrics", tags=["CONFLUENCE"], summary="Get Confluence Metrics")
 async def get_confluence_metrics():
     """Get comprehensive Confluence metrics for analytics"""
@@ -2651,51 +3104,47 @@ async def get_confluence_metrics():
     
     try:
         # Get recent pages
-        recent_pages = await app_state.confluence_client.search("", limit=50)
+        recent_pages = await enrich_confluence_pages(await app_state.confluence_client.search("", limit=50, order_by="created desc"))
         
         # Calculate metrics
         total_pages = len(recent_pages)
         
-        # Count pages created this month
-        from datetime import datetime, timedelta
-        this_month = datetime.now().replace(day=1)
-        pages_this_month = len([
-            p for p in recent_pages 
-            if datetime.fromisoformat(p.get('created', '').replace('Z', '+00:00')) >= this_month
-        ])
-        
-        # Count unique spaces
-        spaces = set(p.get('space', {}).get('name', 'Unknown') for p in recent_pages)
-        total_spaces = len(spaces)
-        
-        # Count unique contributors
-        contributors = set(p.get('author', {}).get('displayName', 'Unknown') for p in recent_pages)
-        active_contributors = len(contributors)
-        
-        # Count pages by space
-        pages_by_space = {}
+        # Count pages created this month; results come newest first, so stop at the first older page
+        this_month = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        pages_this_month = 0
         for page in recent_pages:
-            space = page.get('space', {}).get('name', 'Unknown')
-            pages_by_space[space] = pages_by_space.get(space, 0) + 1
+            created = page.get('created')
+            if not created:
+                continue
+            if _parse_iso(created) < this_month:
+                break
+            pages_this_month += 1
         
-        # Format recent pages
+        # Count pages by space and unique contributors, formatting the first 10 pages, in one pass
+        pages_by_space = Counter()
+        contributors = set()
         formatted_pages = []
-        for page in recent_pages[:10]:
-            formatted_pages.append({
-                "id": page.get('id', ''),
-                "title": page.get('title', 'Untitled'),
-                "space": page.get('space', {}).get('name', 'Unknown'),
-                "author": page.get('author', {}).get('displayName', 'Unknown'),
-                "created": page.get('created', ''),
-                "url": page.get('url', '#')
-            })
+        for page in recent_pages:
+            space = (page.get('space') or _EMPTY_DICT).get('name', 'Unknown')
+            author = (page.get('author') or _EMPTY_DICT).get('displayName', 'Unknown')
+            pages_by_space[space] += 1
+            contributors.add(author)
+            if len(formatted_pages) < 10:
+                formatted_pages.append({
+                    "id": page.get('id', ''),
+                    "title": page.get('title', 'Untitled'),
+                    "space": space,
+                    "author": author,
+                    "created": page.get('created', ''),
+                    "url": page.get('url', '#')
+                })
         
         metrics = {
             "totalPages": total_pages,
             "pagesThisMonth": pages_this_month,
-            "totalSpaces": total_spaces,
-            "activeContributors": active_contributors,
-            "pagesBySpace": pages_by_space,
+            "totalSpaces": len(pages_by_space),
+            "activeContributors": len(contributors),
+            "pagesBySpace": dict(pages_by_space),
             "recentPages": formatted_pages
         }
         
@@ -2742,33 +3191,33 @@ async def get_best_performers(request: Dict[str, Any]):
     try:
         project_key = request.get('projectKey')
         
-        # Build JQL query
+        # Build JQL query; unassigned issues never count toward a performer
         if project_key and project_key != 'null':
-            jql = f'project = "{project_key}"'
+            jql = f'project = "{project_key}" AND {_JQL_ASSIGNED}'
         else:
-            jql = "project is not EMPTY"
-        
-        # Get issues with assignee information
-        fields = ['key', 'summary', 'status', 'assignee', 'priority', 'issuetype', 'project', 'created', 'updated', 'customfield_10016']
+            jql = _JQL_ASSIGNED
         
-        issues = await app_state.jira_client.search_issues(jql, fields=fields, max_results=1000)
+        # Jira caps pages at 100 issues, so page through everything; only fetch the fields the scoring reads
+        issues = await fetch_all_issues(jql, _PERFORMERS_FIELDS)
         
         # Calculate performance metrics for each assignee
         performer_stats = {}
         
         for issue in issues:
-            if not issue or not issue.get('fields'):
+            fields = issue.get('fields') if issue else None
+            if not fields:
                 continue
                 
-            assignee = issue.get('fields', {}).get('assignee')
+            assignee = fields.get('assignee')
             if not assignee:
                 continue
                 
             assignee_name = assignee.get('displayName', 'Unknown')
             assignee_key = assignee.get('key', assignee_name)
             
-            if assignee_key not in performer_stats:
-                performer_stats[assignee_key] = {
+            stats = performer_stats.get(assignee_key)
+            if stats is None:
+                stats = performer_stats[assignee_key] = {
                     'name': assignee_name,
                     'email': assignee.get('emailAddress', ''),
                     'issuesResolved': 0,
@@ -2785,27 +3234,26 @@ async def get_best_performers(request: Dict[str, Any]):
                 }
             
             # Count resolved issues
-            status = issue.get('fields', {}).get('status', {})
-            status_category = status.get('statusCategory', {})
-            if status_category and status_category.get('name') == 'Done':
-                performer_stats[assignee_key]['issuesResolved'] += 1
+            status = fields.get('status') or _EMPTY_DICT
+            is_done = (status.get('statusCategory') or _EMPTY_DICT).get('name') == DONE_CATEGORY
+            if is_done:
+                stats['issuesResolved'] += 1
             
             # Count story points
-            story_points = issue.get('fields', {}).get('customfield_10016')
+            story_points = fields.get('customfield_10016')
             if story_points:
                 try:
-                    performer_stats[assignee_key]['storyPoints'] += int(story_points) or 0
+                    stats['storyPoints'] += int(story_points) or 0
                 except (ValueError, TypeError):
                     pass
             
-            # Count by issue type
-            issue_type = issue.get('fields', {}).get('issuetype', {})
-            if issue_type:
-                type_name = issue_type.get('name')
-                if type_name == 'Bug' and status_category and status_category.get('name') == 'Done':
-                    performer_stats[assignee_key]['bugsFixed'] += 1
-                elif type_name == 'Task' and status_category and status_category.get('name') == 'Done':
-                    performer_stats[assignee_key]['tasksCompleted'] += 1
+            # Count completed bugs and tasks
+            if is_done:
+                type_name = (fields.get('issuetype') or _EMPTY_DICT).get('name')
+                if type_name == 'Bug':
+                    stats['bugsFixed'] += 1
+                elif type_name == 'Task':
+                    stats['tasksCompleted'] += 1
         
         # Calculate performance scores and rank
         performers = list(performer_stats.values())
@@ -2832,70 +3280,198 @@ async def get_best_performers(request: Dict[str, Any]):
             
             performer['achievements'] = achievements
         
-        # Sort by performance score and assign ranks
-        performers.sort(key=lambda x: x['performanceScore'], reverse=True)
-        for i, performer in enumerate(performers):
-            performer['rank'] = i + 1
+        # Select the top 10 by performance score and rank only those
+        top_performers = heapq.nlargest(10, performers, key=lambda x: x['performanceScore'])
+        for i, performer in enumerate(top_performers, 1):
+            performer['rank'] = i
         
         return {
             "success": True,
-            "performers": performers[:10]  # Return top 10 performers
+            "performers": top_performers
         }
         
     except Exception as e:
         logger.error(f"Failed to get best performers: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-async def get_recent_activities():
-    """Get recent activities from both Jira and Confluence"""
-    activities = []
+@app.get("/api/jira/recent-activities", tags=["JIRA"], summary="Get Recent Activities")
+async def get_recent_activities(project: Optional[str] = None):
+    """Get recent activities, serving cached results and revalidating stale ones in the background"""
+    if not (app_state.jira_configured and app_state.jira_client) and not (app_state.confluence_configured and app_state.confluence_client):
+        return _activities_response(_EMPTY_ACTIVITIES_BODY)
+    
+    # The dashboard sends project=all (or null) for every project
+    project_key = project if project and project not in ('all', 'null') else None
+    cache_key = project_key or "__all__"
+    
+    cached = app_state.activities_cache.get(cache_key)
+    if cached:
+        app_state.activities_cache.move_to_end(cache_key)
+        age = time.monotonic() - cached[0]
+        if age < ACTIVITIES_CACHE_FRESH:
+            _schedule_activities_prefetch(project_key)
+            return _activities_response(cached[1])
+        if age < ACTIVITIES_CACHE_STALE:
+            refresh = app_state.activities_refresh.get(cache_key)
+            if refresh is None or refresh.done():
+                _start_activities_task(app_state.activities_refresh, cache_key, _revalidate_recent_activities(project_key))
+            return _activities_response(cached[1])
     
     try:
-        # Get recent Jira activities
-        if app_state.jira_configured and app_state.jira_client:
-            jira_data = await app_state.jira_client.search("ORDER BY updated DESC", max_results=10)
-            jira_issues = jira_data.get('issues', [])
-            for issue in jira_issues:
-                activities.append({
-                    "id": f"jira_{issue.get('key', '')}",
-                    "type": "issue",
-                    "title": f"{issue.get('key', '')} - {issue.get('fields', {}).get('summary', '')}",
-                    "description": f"Status: {issue.get('fields', {}).get('status', {}).get('name', 'Unknown')}",
-                    "author": issue.get('fields', {}).get('assignee', {}).get('displayName', 'Unassigned'),
-                    "timestamp": issue.get('fields', {}).get('updated', ''),
-                    "status": "success" if issue.get('fields', {}).get('status', {}).get('name') in ['Done', 'Resolved'] else "info",
-                    "priority": issue.get('fields', {}).get('priority', {}).get('name', 'Medium'),
-                    "url": f"{app_state.jira_config.base_url}/browse/{issue.get('key', '')}"
-                })
-        
-        # Get recent Confluence activities
-        if app_state.confluence_configured and app_state.confluence_client:
-            confluence_pages = await app_state.confluence_client.search("", limit=10)
-            for page in confluence_pages:
-                activities.append({
-                    "id": f"confluence_{page.get('id', '')}",
-                    "type": "page",
-                    "title": page.get('title', 'Untitled'),
-                    "description": f"Updated in {page.get('space', {}).get('name', 'Unknown')} space",
-                    "author": page.get('author', {}).get('displayName', 'Unknown'),
-                    "timestamp": page.get('updated', ''),
-                    "status": "success",
-                    "space": page.get('space', {}).get('name', 'Unknown'),
-                    "url": page.get('url', '#')
-                })
-        
-        # Sort by timestamp and return recent activities
-        activities.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        
-        return {
-            "success": True,
-            "activities": activities[:20]  # Return top 20 recent activities
-        }
-        
+        async with _activities_lock(cache_key):
+            # Another request may have refreshed the cache while we waited
+            cached = app_state.activities_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < ACTIVITIES_CACHE_FRESH:
+                return _activities_response(cached[1])
+            body = await refresh_recent_activities(project_key)
+        _schedule_activities_prefetch(project_key)
+        return _activities_response(body)
     except Exception as e:
         logger.error(f"Failed to get recent activities: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _activities_response(body: bytes) -> Response:
+    """Wrap a pre-serialized activity feed body, bypassing FastAPI's encoder"""
+    return Response(content=body, media_type="application/json")
+
+@asynccontextmanager
+async def _activities_lock(cache_key: str):
+    """Per-project lock for cold fetches, dropped once no request holds or awaits it"""
+    entry = app_state.activities_locks.get(cache_key)
+    if entry is None:
+        entry = app_state.activities_locks[cache_key] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del app_state.activities_locks[cache_key]
+
+def _start_activities_task(tasks: Dict[str, asyncio.Task], cache_key: str, coro) -> None:
+    """Run a background activities task, tracked under its project key until it finishes"""
+    task = asyncio.create_task(coro)
+    tasks[cache_key] = task
+    app_state.background_tasks.add(task)
+    task.add_done_callback(app_state.background_tasks.discard)
+    task.add_done_callback(lambda done: tasks.pop(cache_key, None) if tasks.get(cache_key) is done else None)
+
+async def refresh_recent_activities(project_key: Optional[str] = None) -> bytes:
+    """Fetch recent activities and cache them serialized, so cache hits skip re-encoding"""
+    body = _json_bytes(await fetch_recent_activities(project_key))
+    cache_key = project_key or "__all__"
+    app_state.activities_cache[cache_key] = (time.monotonic(), body)
+    app_state.activities_cache.move_to_end(cache_key)
+    while len(app_state.activities_cache) > ACTIVITIES_CACHE_MAX_ENTRIES:
+        app_state.activities_cache.popitem(last=False)
+    return body
+
+async def _revalidate_recent_activities(project_key: Optional[str] = None) -> None:
+    """Background refresh of a cached activities entry; the stale copy stays in place on failure"""
+    try:
+        body = _json_bytes(await fetch_recent_activities(project_key))
+    except Exception as e:
+        logger.warning(f"Background refresh of recent activities failed: {e}")
+        return
+    # Only replace entries still cached, so refreshes neither re-add evicted projects nor bump their LRU position
+    cache_key = project_key or "__all__"
+    if cache_key in app_state.activities_cache:
+        app_state.activities_cache[cache_key] = (time.monotonic(), body)
+
+def _jira_activity(issue: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+    """Activity feed entry for a Jira issue"""
+    key = issue.get('key', '')
+    fields = issue.get('fields') or _EMPTY_DICT
+    status = fields.get('status') or _EMPTY_DICT
+    return {
+        "id": f"jira_{key}",
+        "type": "issue",
+        "title": f"{key} - {fields.get('summary', '')}",
+        "description": f"Status: {status.get('name', 'Unknown')}",
+        "author": (fields.get('assignee') or _EMPTY_DICT).get('displayName', 'Unassigned'),
+        "timestamp": fields.get('updated', ''),
+        "status": "success" if status.get('name') in _TERMINAL_STATUSES else "info",
+        "priority": (fields.get('priority') or _EMPTY_DICT).get('name', 'Medium'),
+        "url": f"{base_url}/browse/{key}"
+    }
+
+def _confluence_activity(page: Dict[str, Any]) -> Dict[str, Any]:
+    """Activity feed entry for a Confluence page"""
+    space = (page.get('space') or _EMPTY_DICT).get('name', 'Unknown')
+    return {
+        "id": f"confluence_{page.get('id', '')}",
+        "type": "page",
+        "title": page.get('title', 'Untitled'),
+        "description": f"Updated in {space} space",
+        "author": (page.get('author') or _EMPTY_DICT).get('displayName', 'Unknown'),
+        "timestamp": page.get('updated', ''),
+        "status": "success",
+        "space": space,
+        "url": page.get('url', '#')
+    }
+
+def _schedule_activities_prefetch(project_key: Optional[str] = None) -> None:
+    """Refresh a project's activities cache shortly before it goes stale, keeping at most one prefetch pending per project"""
+    cache_key = project_key or "__all__"
+    prefetch = app_state.activities_prefetch.get(cache_key)
+    if prefetch is not None and not prefetch.done():
+        return
+    _start_activities_task(app_state.activities_prefetch, cache_key, _prefetch_recent_activities(ACTIVITIES_PREFETCH_DELAY, project_key))
+
+async def _prefetch_recent_activities(delay: float, project_key: Optional[str] = None) -> None:
+    """Wait, then refresh the activities cache in the background unless the project was evicted meanwhile"""
+    await asyncio.sleep(delay)
+    if (project_key or "__all__") in app_state.activities_cache:
+        await _revalidate_recent_activities(project_key)
+
+async def fetch_recent_activities(project_key: Optional[str] = None) -> Dict[str, Any]:
+    """Get recent activities from Jira (optionally one project) and Confluence"""
+    # Fetch Jira and Confluence activity concurrently under one deadline; a failing or slow source is logged and skipped
+    sources = {}
+    if app_state.jira_configured and app_state.jira_client:
+        jql = f'project = "{project_key}" ORDER BY updated DESC' if project_key else "ORDER BY updated DESC"
+        sources["Jira"] = asyncio.ensure_future(
+            app_state.jira_client.search(jql, max_results=10, fields=_ACTIVITY_FIELDS))
+    if app_state.confluence_configured and app_state.confluence_client:
+        sources["Confluence"] = asyncio.ensure_future(app_state.confluence_client.search("", limit=10))
+    
+    done = set()
+    if sources:
+        done, pending = await asyncio.wait(sources.values(), timeout=ACTIVITIES_FETCH_TIMEOUT)
+        for task in pending:
+            task.cancel()
+    
+    results = {}
+    for name, task in sources.items():
+        if task not in done:
+            logger.warning(f"Recent {name} activities timed out after {ACTIVITIES_FETCH_TIMEOUT}s")
+        elif task.exception() is not None:
+            logger.warning(f"Recent {name} activities unavailable: {task.exception()}")
+        else:
+            results[name] = task.result()
+    jira_data = results.get("Jira")
+    confluence_pages = results.get("Confluence")
+    
+    # Jira activities are already newest first from the ORDER BY, so they are built lazily as the merge consumes them
+    if jira_data:
+        base_url = app_state.jira_config.base_url
+        jira_activities = (_jira_activity(issue, base_url) for issue in jira_data.get('issues', []))
+    else:
+        jira_activities = ()
+    # Confluence order isn't guaranteed; sorting its few results keeps the merge below valid
+    confluence_activities = sorted(map(_confluence_activity, confluence_pages or ()), key=lambda x: x['timestamp'], reverse=True)
+    
+    # Merge the two newest-first streams and keep the 20 most recent activities
+    merged = heapq.merge(jira_activities, confluence_activities, key=lambda x: x['timestamp'], reverse=True)
+    return {
+        "success": True,
+        "activities": list(itertools.islice(merged, 20))
+    }
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # loop/http "auto" select uvloop and httptools when installed. Jira/Confluence configuration
+    # and caches live in process memory, so run a single worker unless WEB_CONCURRENCY asks for more.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run("main:app" if workers > 1 else app, host="0.0.0.0", port=8000, loop="auto", http="auto", workers=workers)
\ No newline at end of file
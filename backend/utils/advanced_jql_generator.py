@@ -133,7 +133,7 @@ This is a specific issue query for {specific_issue_key}."""
                     }
             
             # 1) Project first (more permissive - don't require validation)
-            tokens = [t for t in self.project_token.findall(q)]
+            tokens = self.project_token.findall(q)
             logger.debug(f"candidate project tokens: {tokens}")
             
             # Filter out common words that aren't project keys
@@ -722,7 +722,7 @@ This is a specific issue query for {specific_issue_key}."""
         try:
             if not project_keys:
                 # Extract project keys from query
-                tokens = [t for t in self.project_token.findall(query)]
+                tokens = self.project_token.findall(query)
                 valid_projects = await self._valid_project_keys()
                 project_keys = [t.upper() for t in tokens if t.upper() in valid_projects]
             
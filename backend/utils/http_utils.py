@@ -0,0 +1,36 @@
+"""
+Shared HTTP and JSON helpers for the Jira and Confluence clients
+"""
+
+import asyncio
+import json
+from typing import Any
+
+import httpx
+
+# Optional faster JSON decoding
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep-alive connection pool shared by all requests from one client
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+
+# Responses larger than this are decoded off the event loop
+LARGE_RESPONSE_BYTES = 512 * 1024
+
+async def decode_json_response(resp: httpx.Response) -> Any:
+    """Decode a JSON body, offloading large payloads to a worker thread"""
+    raw = resp.content
+    if len(raw) > LARGE_RESPONSE_BYTES:
+        return await asyncio.to_thread(json_loads, raw)
+    return json_loads(raw)
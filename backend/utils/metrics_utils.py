@@ -3,6 +3,7 @@ from typing import Optional, List, Dict, Any
 import re
 from datetime import datetime, timezone
 import math
+import numpy as np
 
 @dataclass
 class SprintMetrics:
@@ -87,6 +88,18 @@ def sum_story_points(issue: Dict[str, Any], sp_field_id: Optional[str]) -> float
     except Exception:
         return 0.0
 
+# Project health scoring
+HEALTH_LABELS = ("critical", "needs_attention", "good", "excellent")
+HEALTH_THRESHOLDS = np.array([40.0, 60.0, 80.0])  # lower bounds of the bands above "critical"
+
+def score_projects(completed, total) -> tuple[np.ndarray, np.ndarray]:
+    """Completion-percentage health scores and band indexes into HEALTH_LABELS"""
+    completed = np.asarray(completed, dtype=np.float64)
+    total = np.asarray(total, dtype=np.float64)
+    scores = np.divide(completed * 100.0, total, out=np.zeros_like(completed), where=total > 0)
+    bands = np.searchsorted(HEALTH_THRESHOLDS, scores, side="right")
+    return scores, bands
+
 # Simple forecasting
 def _linear_regression(y: List[float]) -> tuple[float, float]:
     n = len(y)
@@ -0,0 +1,57 @@
+"""
+Tests for JiraClient search coalescing and result caching
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from jira_client import JiraClient, JiraConfig
+
+
+def make_client():
+    """JiraClient whose upstream search returns one issue and counts calls"""
+    client = JiraClient(JiraConfig(base_url="https://example.atlassian.net", email="a@example.com", api_token="token"))
+    client._client = object()  # Skip opening a real HTTP pool
+    client.upstream_calls = 0
+
+    async def search_upstream(*args):
+        client.upstream_calls += 1
+        await asyncio.sleep(0.01)
+        return {"issues": [{"key": "ABC-1", "fields": {"summary": "Login fails"}}], "total": 1}
+
+    client._search_upstream = search_upstream
+    return client
+
+
+def test_mutating_a_cached_result_does_not_leak():
+    async def run():
+        client = make_client()
+        first = await client.search("project = ABC")
+        first["issues"][0]["jira_url"] = "https://example.atlassian.net/browse/ABC-1"
+        first["issues"].append({"key": "ABC-2"})
+
+        second = await client.search("project = ABC")
+        assert client.upstream_calls == 1
+        assert second["issues"] == [{"key": "ABC-1", "fields": {"summary": "Login fails"}}]
+
+    asyncio.run(run())
+
+
+def test_coalesced_callers_get_independent_results():
+    async def run():
+        client = make_client()
+        first, second = await asyncio.gather(client.search("project = ABC"), client.search("project = ABC"))
+        assert client.upstream_calls == 1
+        first["issues"][0]["semantic_score"] = 0.9
+        assert "semantic_score" not in second["issues"][0]
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_mutating_a_cached_result_does_not_leak()
+    test_coalesced_callers_get_independent_results()
+    print("✅ Jira search cache tests passed")
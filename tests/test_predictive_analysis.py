@@ -0,0 +1,65 @@
+"""
+Tests for the predictive analysis endpoint
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+os.environ.pop("OPENAI_API_KEY", None)  # Use the deterministic summary
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+def issue(key, updated, status="Done"):
+    return {"key": key, "fields": {"updated": updated, "status": {"name": status}, "issuetype": {"name": "Story"}}}
+
+
+class FakeJiraClient:
+    """Serves a rising number of updates per day: one on the 1st, two on the 2nd, ..."""
+
+    def __init__(self):
+        self.issues = [issue(f"P-{day}{n}", f"2026-10-{day:02d}T10:00:00.000+0000")
+                       for day in range(1, 8) for n in range(day)]
+
+    async def search(self, jql, max_results=50, fields=None, start_at=0, next_page_token=None, **kwargs):
+        page = self.issues[start_at:start_at + max_results]
+        return {"issues": page, "total": len(self.issues), "isLast": start_at + max_results >= len(self.issues)}
+
+
+def setup_client():
+    main.reset_engines()
+    main.app_state.jira_configured = True
+    main.app_state.jira_client = FakeJiraClient()
+    return TestClient(main.app)
+
+
+def test_predictive_analysis_forecasts_from_history():
+    client = setup_client()
+    response = client.post("/api/jira/predictive-analysis", json={"query": "How busy will we be?"})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["success"] and body["data_points"] == 28
+    prediction = body["prediction"]
+    assert prediction["trend"] == "increasing"
+    assert prediction["days_observed"] == 7
+    assert prediction["daily_change"] == 1.0
+    assert prediction["projected_updates"] > 28
+    assert prediction["summary"]
+
+
+def test_gaps_between_days_count_as_zero():
+    engine = main.IntelligentAIEngine(None)
+    engine.client = None
+    prediction = engine.generate_predictive_analysis("trend?", {"daily_updates": {"2026-10-01": 4, "2026-10-04": 4}})
+    assert prediction["days_observed"] == 4
+    assert prediction["daily_average"] == 2.0
+    assert prediction["trend"] == "stable"
+
+
+if __name__ == "__main__":
+    test_predictive_analysis_forecasts_from_history()
+    test_gaps_between_days_count_as_zero()
+    print("✅ Predictive analysis tests passed")
@@ -0,0 +1,53 @@
+"""
+Tests for the semantic search answer cache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from advanced_chatbot import SemanticQueryCache
+
+
+def test_exact_and_normalized_queries_hit():
+    """Case, spacing and trailing punctuation don't change the key"""
+    cache = SemanticQueryCache()
+    cache.put("What is the status of ABC-123?", "answer")
+    assert cache.get("What is the status of ABC-123?") == "answer"
+    assert cache.get("  what is the   status of abc-123 ") == "answer"
+
+
+def test_queries_differing_in_an_identifier_miss():
+    """Near-identical queries about another ticket, project or person must not share an answer"""
+    cache = SemanticQueryCache()
+    cache.put("What is the status of ABC-123", "abc-123 answer")
+    cache.put("Show open bugs in PROJ1", "proj1 answer")
+    cache.put("What is John working on", "john answer")
+    assert cache.get("What is the status of ABC-124") is None
+    assert cache.get("Show open bugs in PROJ2") is None
+    assert cache.get("What is Joan working on") is None
+
+
+def test_expired_entries_miss():
+    cache = SemanticQueryCache(ttl=0)
+    cache.put("sprint health", "answer")
+    assert cache.get("sprint health") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SemanticQueryCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+if __name__ == "__main__":
+    test_exact_and_normalized_queries_hit()
+    test_queries_differing_in_an_identifier_miss()
+    test_expired_entries_miss()
+    test_least_recently_used_entry_is_evicted()
+    print("✅ SemanticQueryCache tests passed")